@@ -6,6 +6,8 @@ import time
 class GameAnimationQueue:
     def __init__(self):
         self.animations: List[Dict[str, Any]] = []
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._next_id: int = 0
         self.game_state: str = "waiting"
         self.start_time: float = 0.0
     
@@ -21,6 +23,7 @@ class GameAnimationQueue:
         if duration_ms <= 0:
             raise ValueError("Animation duration must be positive")
             
+        self._next_id += 1
         animation = {
             "type": animation_type,
             "duration": duration_ms,
@@ -29,9 +32,10 @@ class GameAnimationQueue:
             "completed": False,
             "progress": 0.0,
             "properties": properties or {},
-            "id": f"{animation_type}_{time.time()}"
+            "id": f"{animation_type}_{self._next_id}"
         }
         self.animations.append(animation)
+        self._by_id[animation["id"]] = animation
         return animation
     
     def update_all_animations(self, current_time_ms: int) -> List[Dict[str, Any]]:
@@ -43,6 +47,7 @@ class GameAnimationQueue:
             if elapsed >= anim["duration"]:
                 anim["completed"] = True
                 completed.append(anim)
+                self._by_id.pop(anim["id"], None)
             else:
                 anim["progress"] = elapsed / anim["duration"]
                 active.append(anim)
@@ -52,6 +57,7 @@ class GameAnimationQueue:
     
     def clear_all_animations(self) -> None:
         self.animations.clear()
+        self._by_id.clear()
     
     def get_active_count(self) -> int:
         return len(self.animations)
@@ -60,17 +66,15 @@ class GameAnimationQueue:
         return bool(self.animations)
         
     def find_animation_by_id(self, animation_id: str) -> Dict[str, Any]:
-        for animation in self.animations:
-            if animation.get("id") == animation_id:
-                return animation
-        return None
+        return self._by_id.get(animation_id)
         
     def remove_animation_by_id(self, animation_id: str) -> bool:
-        for i, animation in enumerate(self.animations):
-            if animation.get("id") == animation_id:
-                self.animations.pop(i)
-                return True
-        return False
+        animation = self._by_id.pop(animation_id, None)
+        if animation is None:
+            return False
+        i = next(i for i, anim in enumerate(self.animations) if anim is animation)
+        self.animations.pop(i)
+        return True
 
 # Backward compatibility methods
     def update(self, event_type: str, data: Dict[str, Any]) -> None:
@@ -10,6 +10,19 @@ from typing import Dict, List
 class GameUI:
     """Compact user interface with simple design"""
     
+    # Upper bound on cached dynamic text surfaces (times, scores, move lines)
+    TEXT_CACHE_SIZE = 256
+    
+    # Piece type -> (singular, plural) label, in table display order
+    PIECE_LABELS = {
+        'K': ('King', 'Kings'),
+        'Q': ('Queen', 'Queens'),
+        'R': ('Rook', 'Rooks'),
+        'B': ('Bishop', 'Bishops'),
+        'N': ('Knight', 'Knights'),
+        'P': ('Pawn', 'Pawns')
+    }
+    
     def __init__(self, panel_width: int = 300):
         """Initialize the UI with professional styling."""
         self.panel_width = panel_width
@@ -42,70 +55,163 @@ class GameUI:
             'text': (30, 30, 30)           # Dark text
         }
 
-    def draw_player_panels(self, screen, board_width, window_height, pieces, selection, start_time, score_mgr=None, move_logger=None):
-        """Draw player panels"""
+        # Rendered text surfaces: constant labels are rendered once here,
+        # everything else goes through a bounded LRU cache in _render
+        self._text_cache = {}
+        self._static = {}
+        for font_key, text, color in (
+            ('title', "Player A", self.colors['blue']),
+            ('title', "Player A", self.colors['border']),
+            ('title', "Player B", self.colors['red']),
+            ('title', "Player B", self.colors['border']),
+            ('normal', "Selected Piece:", self.colors['text']),
+            ('title', "Recent Moves", self.colors['text']),
+            ('title', "Recent Moves", self.colors['gray']),
+            ('title', "No moves yet", self.colors['gray']),
+            ('title', "No moves yet", (220, 220, 220)),
+            ('small', "Move history unavailable", self.colors['gray']),
+        ):
+            self._static[(font_key, text, color)] = self.fonts[font_key].render(text, True, color)
+
+        # Pre-rendered backgrounds, built on first draw once the display exists
+        self._panel_bg = None
+        self._moves_title_bg = None
+        # Per player: (moves shown, laid-out rows) for the recent moves list
+        self._move_rows = {}
+        # Per player: everything the panel showed when it was last painted
+        self._panel_state = {}
+        # Clock label, reformatted only when the whole-second value changes
+        self._clock_seconds = None
+        self._clock_text = ""
+
+    def _render(self, font_key, text, color):
+        """Return a rendered text surface, rasterizing it only on a cache miss."""
+        key = (font_key, text, color)
+        surface = self._static.get(key)
+        if surface is not None:
+            return surface
+        cache = self._text_cache
+        surface = cache.pop(key, None)
+        if surface is None:
+            surface = self.fonts[font_key].render(text, True, color)
+            if len(cache) >= self.TEXT_CACHE_SIZE:
+                del cache[next(iter(cache))]  # least recently used
+        cache[key] = surface
+        return surface
+
+    def draw_player_panels(self, screen, board_width, window_height, pieces, selection, start_time, score_mgr=None, move_logger=None, force=False):
+        """Draw player panels and return the rects that were repainted.
+
+        A panel whose content is unchanged is left as it is on screen unless
+        force is set (e.g. after something was drawn over it).
+        """
+        dirty_rects = []
+        
         # Left panel - Player A
-        self._draw_panel(screen, 0, 0, "A", self.colors['blue'], pieces, selection, start_time, score_mgr, move_logger)
+        rect = self._draw_panel(screen, 0, 0, "A", self.colors['blue'], pieces, selection, start_time, score_mgr, move_logger, force, window_height)
+        if rect:
+            dirty_rects.append(rect)
         
         # Right panel - Player B  
-        self._draw_panel(screen, self.panel_width + board_width, 0, "B", self.colors['red'], pieces, selection, start_time, score_mgr, move_logger)
+        rect = self._draw_panel(screen, self.panel_width + board_width, 0, "B", self.colors['red'], pieces, selection, start_time, score_mgr, move_logger, force, window_height)
+        if rect:
+            dirty_rects.append(rect)
+        return dirty_rects
     
-    def _draw_panel(self, screen, x, y, player, color, pieces, selection, start_time, score_mgr, move_logger):
-        """Draw single panel with professional styling."""
-        # Panel background with border
-        pygame.draw.rect(screen, self.colors['border'], (x, y, self.panel_width, screen.get_height()))
-        pygame.draw.rect(screen, self.colors['bg'], (x+2, y+2, self.panel_width-4, screen.get_height()-4))
+    def _get_panel_background(self, height):
+        """Panel background, border and header box, rendered once per window height."""
+        if self._panel_bg is None or self._panel_bg.get_height() != height:
+            surface = pygame.Surface((self.panel_width, height)).convert()
+            surface.fill(self.colors['border'])
+            surface.fill(self.colors['bg'], (2, 2, self.panel_width-4, height-4))
+            header_rect = (5, 15, self.panel_width-10, 50)
+            surface.fill(self.colors['section'], header_rect)
+            pygame.draw.rect(surface, self.colors['border'], header_rect, 1)
+            self._panel_bg = surface
+        return self._panel_bg
+
+    def _draw_panel(self, screen, x, y, player, color, pieces, selection, start_time, score_mgr, move_logger, force=False, panel_height=None):
+        """Draw single panel with professional styling; return its rect, or None if unchanged."""
+        # The caller already knows the window height; only ask the surface as a fallback
+        height = panel_height or screen.get_height()
         
-        y_pos = y + 15
+        # Gather what the panel shows and skip painting if it is what is already on screen
+        duration = int(time.time() - start_time)
+        if duration != self._clock_seconds:
+            self._clock_seconds = duration
+            self._clock_text = f"Time: {duration//60:02d}:{duration%60:02d}"
+        time_text = self._clock_text
+        score_text = None
+        if score_mgr:
+            try:
+                score_text = f"Score: {score_mgr.get_player_score(player)}"
+            except:
+                pass
+        selected = selection.get(player, {}).get('selected') if selection else None
+        moves = None
+        if move_logger:
+            try:
+                moves = move_logger.get_recent_moves_for_player(player)[-5:]
+            except:
+                pass
+        panel_state = (height, time_text, score_text, selected.piece_id if selected else None, moves)
+        if not force and self._panel_state.get(player) == panel_state:
+            return None
+        self._panel_state[player] = panel_state
         
-        # Player header section with background
+        # Hot lookups bound once for the rest of the paint
+        render = self._render
+        colors = self.colors
+        panel_width = self.panel_width
+        
+        # Panel background with border and the player header box
+        screen.blit(self._get_panel_background(height), (x, y))
+        
+        y_pos = y + 15
         header_height = 50
-        pygame.draw.rect(screen, self.colors['section'], (x+5, y_pos, self.panel_width-10, header_height))
-        pygame.draw.rect(screen, self.colors['border'], (x+5, y_pos, self.panel_width-10, header_height), 1)
+        
+        # Text for the panel is collected here and blitted in a single call
+        blit_list = []
         
         # Player title - centered with glow effect
-        title_shadow = self.fonts['title'].render(f"Player {player}", True, self.colors['border'])
-        title = self.fonts['title'].render(f"Player {player}", True, color)
-        title_x = x + (self.panel_width - title.get_width()) // 2
-        screen.blit(title_shadow, (title_x + 1, y_pos + 9))
-        screen.blit(title, (title_x, y_pos + 8))
+        title_shadow = render('title', f"Player {player}", colors['border'])
+        title = render('title', f"Player {player}", color)
+        title_x = x + (panel_width - title.get_width()) // 2
+        blit_list.append((title_shadow, (title_x + 1, y_pos + 9)))
+        blit_list.append((title, (title_x, y_pos + 8)))
         
         # Time - centered with subtle shadow
-        duration = int(time.time() - start_time)
-        time_text = f"Time: {duration//60:02d}:{duration%60:02d}"
-        time_shadow = self.fonts['normal'].render(time_text, True, self.colors['border'])
-        time_surf = self.fonts['normal'].render(time_text, True, self.colors['text'])
-        time_x = x + (self.panel_width - time_surf.get_width()) // 2
-        screen.blit(time_surf, (time_x, y_pos + 28))
+        time_surf = render('normal', time_text, colors['text'])
+        time_x = x + (panel_width - time_surf.get_width()) // 2
+        blit_list.append((time_surf, (time_x, y_pos + 28)))
         
         y_pos += header_height + 15
         
         # Score (if available)
-        if score_mgr:
-            try:
-                score = score_mgr.get_player_score(player)
-                score_surf = self.fonts['normal'].render(f"Score: {score}", True, self.colors['text'])
-                screen.blit(score_surf, (x + 10, y_pos))
-                y_pos += 25
-            except:
-                pass
+        if score_text is not None:
+            score_surf = render('normal', score_text, colors['text'])
+            blit_list.append((score_surf, (x + 10, y_pos)))
+            y_pos += 25
         
         # Selected piece
-        selected = selection.get(player, {}).get('selected') if selection else None
         if selected:
-            sel_surf = self.fonts['normal'].render("Selected Piece:", True, self.colors['text'])
-            screen.blit(sel_surf, (x + 10, y_pos))
+            sel_surf = render('normal', "Selected Piece:", colors['text'])
+            blit_list.append((sel_surf, (x + 10, y_pos)))
             y_pos += 25
             
-            piece_surf = self.fonts['normal'].render(selected.piece_id[-4:], True, color)
-            piece_x = x + (self.panel_width - piece_surf.get_width()) // 2
-            screen.blit(piece_surf, (piece_x, y_pos))
+            piece_surf = render('normal', selected.piece_id[-4:], color)
+            piece_x = x + (panel_width - piece_surf.get_width()) // 2
+            blit_list.append((piece_surf, (piece_x, y_pos)))
             y_pos += 35
         
+        screen.blits(blit_list, doreturn=False)
+        
         # Recent moves
         if move_logger:
             y_pos += 15
-            self._draw_moves_mini(screen, x, y_pos, player, move_logger)
+            self._draw_moves_mini(screen, x, y_pos, player, move_logger, moves)
+        
+        return pygame.Rect(x, y, panel_width, height)
     
     def _get_player_pieces(self, pieces, player):
         """Get pieces by player"""
@@ -127,7 +233,7 @@ class GameUI:
         pygame.draw.rect(screen, self.colors['section'], (x+10, y, title_width, title_height))
         pygame.draw.rect(screen, self.colors['border'], (x+10, y, title_width, title_height), 1)
         
-        title_surf = self.fonts['normal'].render("Active Pieces", True, self.colors['white'])
+        title_surf = self._render('normal', "Active Pieces", self.colors['white'])
         title_x = x + (self.panel_width - title_surf.get_width()) // 2
         screen.blit(title_surf, (title_x, y + 5))
         y += title_height + 5
@@ -139,14 +245,6 @@ class GameUI:
         
         # Count pieces by type
         piece_counts = {}
-        piece_names = {
-            'K': 'King',
-            'Q': 'Queen', 
-            'R': 'Rook',
-            'B': 'Bishop',
-            'N': 'Knight',
-            'P': 'Pawn'
-        }
         
         for piece in pieces:
             piece_type = piece.piece_id[0] if piece.piece_id else '?'
@@ -157,29 +255,18 @@ class GameUI:
         col_width = title_width // 2
         row_height = 22
         
-        for i, piece_type in enumerate(['K', 'Q', 'R', 'B', 'N', 'P']):
+        for i, (piece_type, labels) in enumerate(self.PIECE_LABELS.items()):
             if piece_type in piece_counts:
                 count = piece_counts[piece_type]
-                name = piece_names.get(piece_type, piece_type)
-                
-                # Format piece name and count
-                if count == 1:
-                    text = f"{name}"
-                else:
-                    plural_name = name + "s" if name.endswith(('h', 's', 'x')) else name + "s"
-                    if name == "Knight":
-                        plural_name = "Knights"
-                    elif name == "Bishop":
-                        plural_name = "Bishops"
-                    text = f"{plural_name}"
+                text = labels[0 if count == 1 else 1]
                 
                 # Draw piece name
-                name_surf = self.fonts['small'].render(text, True, self.colors['white'])
+                name_surf = self._render('small', text, self.colors['white'])
                 screen.blit(name_surf, (x + 20, y + (i * row_height)))
                 
                 # Draw count with right alignment
                 count_text = str(count)
-                count_surf = self.fonts['small'].render(count_text, True, self.colors['gray'])
+                count_surf = self._render('small', count_text, self.colors['gray'])
                 count_x = x + col_width + (col_width - count_surf.get_width()) - 20
                 screen.blit(count_surf, (count_x, y + (i * row_height)))
         
@@ -192,8 +279,8 @@ class GameUI:
         # Total pieces with right alignment
         total = len(pieces)
         total_text = "Total Pieces"
-        total_label = self.fonts['normal'].render(total_text, True, self.colors['white'])
-        total_count = self.fonts['normal'].render(str(total), True, self.colors['gray'])
+        total_label = self._render('normal', total_text, self.colors['white'])
+        total_count = self._render('normal', str(total), self.colors['gray'])
         
         screen.blit(total_label, (x + 20, sep_y + 10))
         total_x = x + col_width + (col_width - total_count.get_width()) - 20
@@ -201,111 +288,122 @@ class GameUI:
         
         return sep_y + 40
     
-    def _draw_moves_mini(self, screen, x, y, player, move_logger):
-        """Draw recent moves with enhanced styling."""
+    def _draw_moves_mini(self, screen, x, y, player, move_logger, moves=None):
+        """Draw recent moves with enhanced styling; moves may be passed in if already fetched."""
+        render = self._render
+        colors = self.colors
+        panel_width = self.panel_width
+        
         # Section title with background
         title_height = 40
-        title_width = self.panel_width - 20
+        title_width = panel_width - 20
         
-        # Title background with gradient effect
-        for i in range(title_height):
-            alpha = 255 - (i * 2)
-            current_color = (
-                self.colors['section'][0],
-                self.colors['section'][1],
-                self.colors['section'][2]
-            )
-            pygame.draw.rect(screen, current_color, (x+10, y+i, title_width, 1))
-            
-        pygame.draw.rect(screen, self.colors['border'], (x+10, y, title_width, title_height), 2)
+        # Title background with border, rendered once
+        if self._moves_title_bg is None:
+            self._moves_title_bg = pygame.Surface((title_width, title_height)).convert()
+            self._moves_title_bg.fill(colors['section'])
+            pygame.draw.rect(self._moves_title_bg, colors['border'], (0, 0, title_width, title_height), 2)
+        screen.blit(self._moves_title_bg, (x+10, y))
         
         # Title with shadow effect
         shadow_offset = 1
-        title_shadow = self.fonts['title'].render("Recent Moves", True, self.colors['gray'])
-        title = self.fonts['title'].render("Recent Moves", True, self.colors['text'])
+        title_shadow = render('title', "Recent Moves", colors['gray'])
+        title = render('title', "Recent Moves", colors['text'])
         
-        title_x = x + (self.panel_width - title.get_width()) // 2
-        screen.blit(title_shadow, (title_x + shadow_offset, y + 5 + shadow_offset))
-        screen.blit(title, (title_x, y + 5))
+        title_x = x + (panel_width - title.get_width()) // 2
+        screen.blits(((title_shadow, (title_x + shadow_offset, y + 5 + shadow_offset)),
+                      (title, (title_x, y + 5))), doreturn=False)
         y += title_height + 5
         
         # Moves list background - taller for better visibility
         moves_height = 200
-        pygame.draw.rect(screen, self.colors['white'], (x+10, y, title_width, moves_height))
-        pygame.draw.rect(screen, self.colors['border'], (x+10, y, title_width, moves_height), 2)
+        pygame.draw.rect(screen, colors['white'], (x+10, y, title_width, moves_height))
+        pygame.draw.rect(screen, colors['border'], (x+10, y, title_width, moves_height), 2)
         
         try:
             # Show more moves
-            moves = move_logger.get_recent_moves_for_player(player)[-5:]  # Show last 5 moves
+            if moves is None:
+                moves = move_logger.get_recent_moves_for_player(player)[-5:]  # Show last 5 moves
             if moves:
                 y += 15  # More padding at top
-                for i, move in enumerate(moves):
+                badge_color = colors['blue'] if player == 'A' else colors['red']
+                for i, row in enumerate(self._get_move_rows(player, moves)):
                     # Move number badge
-                    move_num = len(moves) - i
-                    badge_color = self.colors['blue'] if player == 'A' else self.colors['red']
                     pygame.draw.circle(screen, badge_color, (x + 30, y + 10), 12)
-                    num_surf = self.fonts['small'].render(str(move_num), True, self.colors['white'])
-                    num_x = x + 30 - num_surf.get_width()//2
-                    num_y = y + 10 - num_surf.get_height()//2
-                    screen.blit(num_surf, (num_x, num_y))
-                    
-                    # Smart move text formatting
-                    if len(move) > 35:
-                        if "→" in move:
-                            parts = move.split("→")
-                            if len(parts) == 2:
-                                left_part = parts[0].strip()
-                                right_part = parts[1].strip()
-                                
-                                # Format time separately
-                                time_part = left_part[:8] if len(left_part) >= 8 else ""
-                                move_part = left_part[8:] if len(left_part) >= 8 else left_part
-                                
-                                # Draw time in gray
-                                if time_part:
-                                    time_surf = self.fonts['small'].render(time_part, True, self.colors['gray'])
-                                    screen.blit(time_surf, (x + 50, y))
-                                
-                                # Draw move with arrow
-                                if len(move_part) > 12:
-                                    move_part = move_part[:10] + ".."
-                                move_text = f"{move_part} ⟹ {right_part}"
-                            else:
-                                move_text = move[:32] + "..."
-                        else:
-                            move_text = move[:32] + "..."
-                    else:
-                        move_text = move
-                    
-                    # Draw move text with shadow effect
-                    shadow_surf = self.fonts['normal'].render(move_text, True, self.colors['gray'])
-                    move_surf = self.fonts['normal'].render(move_text, True, self.colors['text'])
-                    
-                    text_x = x + (70 if ":" in move else 25)
-                    screen.blit(shadow_surf, (text_x + 1, y + 1))
-                    screen.blit(move_surf, (text_x, y))
+                    # Text for this row goes out in one blits() call, before the separator
+                    screen.blits([(surf, (x + dx, y + dy)) for surf, dx, dy in row], doreturn=False)
                     
                     # Add minimal separator with darker color for dark theme
                     if i < len(moves) - 1:
                         sep_y = y + 18
-                        pygame.draw.line(screen, self.colors['border'],
+                        pygame.draw.line(screen, colors['border'],
                                       (x + 10, sep_y),
                                       (x + title_width - 10, sep_y), 1)
                     
                     y += 25  # Reduced space between moves
             else:
                 # No moves message - centered with style
-                no_moves_surf = self.fonts['title'].render("No moves yet", True, self.colors['gray'])
+                no_moves_surf = render('title', "No moves yet", colors['gray'])
                 no_moves_x = x + (title_width - no_moves_surf.get_width()) // 2
                 no_moves_y = y + (moves_height - no_moves_surf.get_height()) // 2
                 
                 # Draw with shadow effect
-                shadow_surf = self.fonts['title'].render("No moves yet", True, (220, 220, 220))
-                screen.blit(shadow_surf, (no_moves_x + 1, no_moves_y + 1))
-                screen.blit(no_moves_surf, (no_moves_x, no_moves_y))
+                shadow_surf = render('title', "No moves yet", (220, 220, 220))
+                screen.blits(((shadow_surf, (no_moves_x + 1, no_moves_y + 1)),
+                              (no_moves_surf, (no_moves_x, no_moves_y))), doreturn=False)
         except:
             # Error message - centered
-            error_surf = self.fonts['small'].render("Move history unavailable", True, self.colors['gray'])
+            error_surf = render('small', "Move history unavailable", colors['gray'])
             error_x = x + (title_width - error_surf.get_width()) // 2
             error_y = y + (moves_height - error_surf.get_height()) // 2
             screen.blit(error_surf, (error_x, error_y))
+
+    def _get_move_rows(self, player, moves):
+        """Laid-out text for the recent moves list, rebuilt only when the moves change."""
+        cached = self._move_rows.get(player)
+        if cached is not None and cached[0] == moves:
+            return cached[1]
+        rows = [self._layout_move_row(len(moves) - i, move) for i, move in enumerate(moves)]
+        self._move_rows[player] = (moves, rows)
+        return rows
+
+    def _layout_move_row(self, move_num, move):
+        """Return (surface, dx, dy) blits for one move row, relative to the row origin."""
+        render = self._render
+        colors = self.colors
+        row = []
+        num_surf = render('small', str(move_num), colors['white'])
+        row.append((num_surf, 30 - num_surf.get_width()//2, 10 - num_surf.get_height()//2))
+        
+        # Smart move text formatting
+        if len(move) > 35:
+            if "→" in move:
+                parts = move.split("→")
+                if len(parts) == 2:
+                    left_part = parts[0].strip()
+                    right_part = parts[1].strip()
+                    
+                    # Format time separately
+                    time_part = left_part[:8] if len(left_part) >= 8 else ""
+                    move_part = left_part[8:] if len(left_part) >= 8 else left_part
+                    
+                    # Draw time in gray
+                    if time_part:
+                        row.append((render('small', time_part, colors['gray']), 50, 0))
+                    
+                    # Draw move with arrow
+                    if len(move_part) > 12:
+                        move_part = move_part[:10] + ".."
+                    move_text = f"{move_part} ⟹ {right_part}"
+                else:
+                    move_text = move[:32] + "..."
+            else:
+                move_text = move[:32] + "..."
+        else:
+            move_text = move
+        
+        # Move text with shadow effect
+        text_dx = 70 if ":" in move else 25
+        row.append((render('normal', move_text, colors['gray']), text_dx + 1, 1))
+        row.append((render('normal', move_text, colors['text']), text_dx, 0))
+        return row
@@ -60,6 +60,9 @@ class PromotionUI:
         # Initialize content mappings
         self.piece_names = self._initialize_piece_names()
         self.instructions = self._initialize_instructions()
+        
+        # Dimming overlay, built on first use once the display format is known
+        self._overlay: Optional[pygame.Surface] = None
     
     def _calculate_popup_dimensions(self) -> PopupDimensions:
         """Calculate popup position and dimensions."""
@@ -120,10 +123,12 @@ class PromotionUI:
     
     def _draw_overlay(self, surface: pygame.Surface):
         """Draw semi-transparent overlay."""
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(self.OVERLAY_ALPHA)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        if self._overlay is None:
+            overlay = pygame.Surface((self.screen_width, self.screen_height)).convert()
+            overlay.set_alpha(self.OVERLAY_ALPHA)
+            overlay.fill((0, 0, 0))
+            self._overlay = overlay
+        surface.blit(self._overlay, (0, 0))
     
     def _draw_popup_background(self, surface: pygame.Surface):
         """Draw popup background and border."""
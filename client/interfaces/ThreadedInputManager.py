@@ -2,11 +2,55 @@ import queue
 import threading
 import pygame
 import time
+from dataclasses import dataclass
 from typing import Dict, Tuple, Optional
-from Command import Command
+from Command import Command, CommandType
 from ChessRulesValidator import ChessRulesValidator
 from EventTypes import INVALID_MOVE, PAWN_PROMOTION
 
+# (row, col) step of the selection cursor for each movement action
+CURSOR_DIRECTIONS = {'up': (-1, 0), 'down': (1, 0), 'left': (0, -1), 'right': (0, 1)}
+
+
+def _discard_event(event_type, data):
+    """Publisher used when no event bus is attached."""
+
+
+class _KeyAccess:
+    """Dict-style access for callers written against the old per-player dicts."""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+@dataclass(slots=True)
+class PlayerSelection(_KeyAccess):
+    """A player's cursor cell, highlight color and currently selected piece."""
+    pos: list
+    color: Tuple[int, int, int]
+    selected: object = None
+
+
+@dataclass(slots=True)
+class PromotionState(_KeyAccess):
+    """A player's pawn promotion progress and menu cursor."""
+    active: bool = False
+    pending: bool = False
+    piece: object = None
+    target_pos: Optional[tuple] = None
+    menu_selection: int = 0
+    pending_since: int = 0
+
 
 class ThreadedInputManager(threading.Thread):
     """Threaded input manager that runs parallel to the game and listens for input."""
@@ -17,6 +61,8 @@ class ThreadedInputManager(threading.Thread):
         self.board = board
         self.user_input_queue = user_input_queue
         self.event_bus = event_bus
+        # Bound once so publishing sites need no event-bus check or attribute chain
+        self._publish = event_bus.publish if event_bus else _discard_event
         self.chess_validator = ChessRulesValidator()
         self.debug = debug
         
@@ -26,8 +72,8 @@ class ThreadedInputManager(threading.Thread):
         
         # Player selections
         self.selection = {
-            'A': {'pos': [0, 0], 'selected': None, 'color': (255, 0, 0)},
-            'B': {'pos': [7, 7], 'selected': None, 'color': (0, 0, 255)}
+            'A': PlayerSelection(pos=[0, 0], color=(255, 0, 0)),
+            'B': PlayerSelection(pos=[7, 7], color=(0, 0, 255))
         }
         
         # Promotion state
@@ -43,13 +89,12 @@ class ThreadedInputManager(threading.Thread):
         self._game_time_func = None
         self._last_key_time = {}
         self._key_repeat_delay = 0.25
+        # Key bindings only change with the network settings; cached for the polling loop
+        self._key_bindings = tuple(self._get_key_mappings().items())
     
-    def _create_promotion_state(self) -> Dict:
+    def _create_promotion_state(self) -> PromotionState:
         """Create initial promotion state for a player."""
-        return {
-            'active': False, 'pending': False, 'piece': None, 
-            'target_pos': None, 'menu_selection': 0, 'pending_since': 0
-        }
+        return PromotionState()
         
     def set_game_references(self, pieces_dict, game_time_func):
         """Set references to game pieces and time function."""
@@ -60,6 +105,7 @@ class ThreadedInputManager(threading.Thread):
         """Set network game settings."""
         self.is_network_game = is_network_game
         self.my_player_color = my_player_color  # 'white' or 'black'
+        self._key_bindings = tuple(self._get_key_mappings().items())
         
         if self.debug and is_network_game:
             print(f"🌐 Network mode: Playing as {my_player_color}")
@@ -73,10 +119,6 @@ class ThreadedInputManager(threading.Thread):
             # In local games, both players can control any piece
             return True
         
-        # In network games, restrict based on color
-        if not hasattr(piece, 'color'):
-            return True  # Allow if piece has no color attribute
-        
         # Map network player color to local player behavior
         if self.my_player_color == 'white':
             # If I'm the white player, I can only control white pieces
@@ -117,9 +159,9 @@ class ThreadedInputManager(threading.Thread):
         
         for player in ['A', 'B']:
             state = self.promotion_state[player]
-            if state['pending'] and not state['active']:
-                piece = state['piece']
-                target_pos = state['target_pos']
+            if state.pending and not state.active:
+                piece = state.piece
+                target_pos = state.target_pos
                 
                 # Check if piece has reached target position and is not moving
                 if (piece and 
@@ -132,22 +174,21 @@ class ThreadedInputManager(threading.Thread):
                     # If piece reached target and stopped moving, activate promotion
                     if (current_pos == target_pos and 
                         not is_moving and 
-                        now - state['pending_since'] > 500):  # 500ms delay to ensure movement/combat completed
+                        now - state.pending_since > 500):  # 500ms delay to ensure movement/combat completed
                         
                         # Activate promotion menu
-                        state['active'] = True
-                        state['pending'] = False
-                        state['menu_selection'] = 0
+                        state.active = True
+                        state.pending = False
+                        state.menu_selection = 0
                         
                         # Publish promotion event
-                        if self.event_bus:
-                            self.event_bus.publish(PAWN_PROMOTION, {
-                                "player": player,
-                                "piece_id": piece.piece_id,
-                                "from_pos": target_pos,  # Now they're the same
-                                "to_pos": target_pos,
-                                "options": self.promotion_options
-                            })
+                        self._publish(PAWN_PROMOTION, {
+                            "player": player,
+                            "piece_id": piece.piece_id,
+                            "from_pos": target_pos,  # Now they're the same
+                            "to_pos": target_pos,
+                            "options": self.promotion_options
+                        })
                         
                         print(f" Player {player}: Pawn promotion! Select your piece.")
                         break
@@ -203,7 +244,7 @@ class ThreadedInputManager(threading.Thread):
             self.user_input_queue.put(Command(
                 timestamp=int(current_time * 1000),
                 piece_id="SYSTEM",
-                type="QUIT",
+                type=CommandType.QUIT,
                 params=[]
             ))
             self._running = False
@@ -211,7 +252,7 @@ class ThreadedInputManager(threading.Thread):
             self.user_input_queue.put(Command(
                 timestamp=int(current_time * 1000),
                 piece_id="SYSTEM",
-                type="SHOW_STATS",
+                type=CommandType.SHOW_STATS,
                 params=[]
             ))
     
@@ -225,7 +266,7 @@ class ThreadedInputManager(threading.Thread):
             elif self.my_player_color == 'black' and player != 'B':
                 return  # Black player can only control Player B (black pieces)
         
-        if self.promotion_state[player]['active']:
+        if self.promotion_state[player].active:
             if self.debug:
                 print(f"PROMOTION DEBUG: Player {player} pressed {action}")
             if action in ['left', 'right']:
@@ -250,7 +291,7 @@ class ThreadedInputManager(threading.Thread):
                 
                 self.check_pending_promotions()
                 
-                for key_code, (player_or_system, action) in self._get_key_mappings().items():
+                for key_code, (player_or_system, action) in self._key_bindings:
                     if keys[key_code]:
                         # Check repeat delay
                         if (key_code in self._last_key_time and 
@@ -277,18 +318,13 @@ class ThreadedInputManager(threading.Thread):
         
     def _move_selection(self, player: str, direction: str):
         """Move the selection cursor for the given player."""
-        pos = self.selection[player]['pos']
+        pos = self.selection[player].pos
         old_pos = pos.copy()
 
-        if direction == 'up' and pos[0] > 0:
-            pos[0] -= 1
-        elif direction == 'down' and pos[0] < self.board.H_cells - 1:
-            pos[0] += 1
-        elif direction == 'left' and pos[1] > 0:
-            pos[1] -= 1
-        elif direction == 'right' and pos[1] < self.board.W_cells - 1:
-            pos[1] += 1
-            
+        row_step, col_step = CURSOR_DIRECTIONS[direction]
+        pos[0] = max(0, min(self.board.H_cells - 1, pos[0] + row_step))
+        pos[1] = max(0, min(self.board.W_cells - 1, pos[1] + col_step))
+
         if old_pos != pos and self.debug:
             print(f"Player {player}: {old_pos} → {pos}")
 
@@ -297,8 +333,9 @@ class ThreadedInputManager(threading.Thread):
         if not self._pieces_ref or not self._game_time_func:
             return  # Game references not set yet
             
-        pos = tuple(self.selection[player]['pos'])
-        selected = self.selection[player]['selected']
+        selection = self.selection[player]
+        pos = tuple(selection.pos)
+        selected = selection.selected
 
         if selected is None:
             self._try_select_piece_at_position(player, pos)
@@ -325,11 +362,8 @@ class ThreadedInputManager(threading.Thread):
         
         # Find piece at position with correct color
         for piece in self._pieces_ref.values():
-            p_pos = tuple(piece.current_state.physics.current_cell)
-            
-            # Check position and color match
-            if p_pos == pos and hasattr(piece, 'color') and piece.color == allowed_piece_color:
-                self.selection[player]['selected'] = piece
+            if piece.current_state.physics.current_cell == pos and piece.color == allowed_piece_color:
+                self.selection[player].selected = piece
                 if self.debug:
                     if self.is_network_game:
                         print(f" ✅ Player {player} (my_color={self.my_player_color}) selected {piece.piece_id} (piece_color={piece.color}) at {pos}")
@@ -350,7 +384,7 @@ class ThreadedInputManager(threading.Thread):
 
     def _try_move_selected_piece(self, player: str, selected, pos: tuple):
         """Try to move the selected piece to the given position."""
-        start_pos = tuple(selected.current_state.physics.current_cell)
+        start_pos = selected.current_state.physics.current_cell
         
         if start_pos == pos:
             self._handle_jump_action(player, selected, pos)
@@ -361,7 +395,7 @@ class ThreadedInputManager(threading.Thread):
         else:
             self._handle_invalid_move(player, selected, start_pos, pos, "Not a valid move")
         
-        self.selection[player]['selected'] = None
+        self.selection[player].selected = None
 
     def _handle_jump_action(self, player: str, selected, pos: tuple):
         """Handle jump action when selecting same position."""
@@ -369,13 +403,11 @@ class ThreadedInputManager(threading.Thread):
         cmd = Command.create_jump_command(now, selected.piece_id, pos, pos)
         self.user_input_queue.put(cmd)
         print(f"🦘 Player {player}: {selected.piece_id} jumps at {pos}")
-        self.selection[player]['selected'] = None
+        self.selection[player].selected = None
 
     def _is_move_allowed(self, selected, start_pos: tuple, target_pos: tuple) -> bool:
         """Check if the move is allowed by piece movement rules."""
-        moves = selected.current_state.moves
-        valid_moves = moves.get_moves(start_pos[0], start_pos[1])
-        return target_pos in valid_moves
+        return selected.current_state.moves.is_target_reachable_from_position(start_pos, target_pos)
 
     def _execute_validated_move(self, player: str, selected, start_pos: tuple, pos: tuple):
         """Execute a move after validating chess rules."""
@@ -392,7 +424,7 @@ class ThreadedInputManager(threading.Thread):
     def _find_piece_at_position(self, pos: tuple):
         """Find a piece at the given position."""
         for piece in self._pieces_ref.values():
-            if tuple(piece.current_state.physics.current_cell) == pos:
+            if piece.current_state.physics.current_cell == pos:
                 return piece
         return None
 
@@ -404,10 +436,11 @@ class ThreadedInputManager(threading.Thread):
         print(f"Player {player}: {selected.piece_id} {start_pos} → {pos} (moving for promotion)")
         
         # Mark promotion as pending
-        self.promotion_state[player]['pending'] = True
-        self.promotion_state[player]['piece'] = selected
-        self.promotion_state[player]['target_pos'] = pos
-        self.promotion_state[player]['pending_since'] = now
+        promotion = self.promotion_state[player]
+        promotion.pending = True
+        promotion.piece = selected
+        promotion.target_pos = pos
+        promotion.pending_since = now
         
         print(f" Player {player}: Pawn promotion pending - waiting for movement to complete")
 
@@ -420,18 +453,17 @@ class ThreadedInputManager(threading.Thread):
 
     def _handle_invalid_move(self, player: str, selected, start_pos: tuple, pos: tuple, reason: str):
         """Handle an invalid move by publishing event and logging."""
-        if self.event_bus:
-            self.event_bus.publish(INVALID_MOVE, {
-                "player": player,
-                "piece_id": selected.piece_id,
-                "from_pos": start_pos,
-                "to_pos": pos,
-                "reason": reason
-            })
+        self._publish(INVALID_MOVE, {
+            "player": player,
+            "piece_id": selected.piece_id,
+            "from_pos": start_pos,
+            "to_pos": pos,
+            "reason": reason
+        })
         if self.debug:
             print(f" {reason}: {selected.piece_id} {start_pos} → {pos}")
     
-    def get_selection(self, player: str) -> Dict:
+    def get_selection(self, player: str) -> PlayerSelection:
         """Get the current selection for a player."""
         return self.selection[player]
     
@@ -441,29 +473,31 @@ class ThreadedInputManager(threading.Thread):
     
     def _handle_promotion_navigation(self, player: str, direction: str):
         """Handle navigation in promotion menu."""
-        if not self.promotion_state[player]['active']:
+        promotion = self.promotion_state[player]
+        if not promotion.active:
             return
             
-        print(f" PROMOTION NAV: Player {player} direction {direction}, current={self.promotion_state[player]['menu_selection']}")
+        print(f" PROMOTION NAV: Player {player} direction {direction}, current={promotion.menu_selection}")
             
-        if direction == 'left' and self.promotion_state[player]['menu_selection'] > 0:
-            self.promotion_state[player]['menu_selection'] -= 1
-            print(f" Player {player}: Promotion menu ← {self.promotion_options[self.promotion_state[player]['menu_selection']]}")
-        elif direction == 'right' and self.promotion_state[player]['menu_selection'] < len(self.promotion_options) - 1:
-            self.promotion_state[player]['menu_selection'] += 1
-            print(f" Player {player}: Promotion menu → {self.promotion_options[self.promotion_state[player]['menu_selection']]}")
+        if direction == 'left' and promotion.menu_selection > 0:
+            promotion.menu_selection -= 1
+            print(f" Player {player}: Promotion menu ← {self.promotion_options[promotion.menu_selection]}")
+        elif direction == 'right' and promotion.menu_selection < len(self.promotion_options) - 1:
+            promotion.menu_selection += 1
+            print(f" Player {player}: Promotion menu → {self.promotion_options[promotion.menu_selection]}")
         else:
             print(f" PROMOTION NAV: No movement possible - at edge or invalid direction")
     
     def _confirm_promotion(self, player: str):
         """Confirm promotion choice and execute the move."""
-        if not self.promotion_state[player]['active']:
+        promotion = self.promotion_state[player]
+        if not promotion.active:
             return
             
-        selected_piece = self.promotion_state[player]['piece']
-        target_pos = self.promotion_state[player]['target_pos']
-        start_pos = tuple(selected_piece.current_state.physics.current_cell)
-        promotion_choice = self.promotion_options[self.promotion_state[player]['menu_selection']]
+        selected_piece = promotion.piece
+        target_pos = promotion.target_pos
+        start_pos = selected_piece.current_state.physics.current_cell
+        promotion_choice = self.promotion_options[promotion.menu_selection]
         
         # Create promotion command
         now = self._game_time_func()
@@ -473,17 +507,12 @@ class ThreadedInputManager(threading.Thread):
         print(f" Player {player}: Promoted {selected_piece.piece_id} to {promotion_choice} at {target_pos}")
         
         # Reset promotion state
-        self.promotion_state[player]['active'] = False
-        self.promotion_state[player]['pending'] = False
-        self.promotion_state[player]['piece'] = None
-        self.promotion_state[player]['target_pos'] = None
-        self.promotion_state[player]['menu_selection'] = 0
-        self.promotion_state[player]['pending_since'] = 0
+        self.promotion_state[player] = self._create_promotion_state()
     
-    def get_promotion_state(self, player: str) -> Dict:
+    def get_promotion_state(self, player: str) -> PromotionState:
         """Get current promotion state for player."""
         if player in self.promotion_state:
             return self.promotion_state[player]
         else:
             # Return default state if player not found
-            return {'active': False, 'piece': None, 'target_pos': None, 'menu_selection': 0}
+            return self._create_promotion_state()
@@ -111,18 +111,21 @@ class Img:
             # Create a copy first
             tinted = self.copy()
             
-            # Convert to float for calculations
-            img_float = tinted.img.astype(np.float32)
-            original_float = img_float.copy()
+            # Each output channel depends only on that channel's input value, so the
+            # float math runs once over the 256 possible values and the image goes
+            # through a single lookup-table pass
+            values = np.arange(256, dtype=np.float32)
+            channels = tinted.img.shape[2]
             
             # OpenCV uses BGR format: [Blue, Green, Red]
             # Enhance blue channel and reduce red/green based on intensity
-            img_float[:, :, 0] = np.minimum(img_float[:, :, 0] * (1.0 + 0.8 * intensity) + 80 * intensity, 255)  # Enhance Blue
-            img_float[:, :, 1] = img_float[:, :, 1] * (1.0 - 0.7 * intensity)  # Reduce Green  
-            img_float[:, :, 2] = img_float[:, :, 2] * (1.0 - 0.7 * intensity)  # Reduce Red
+            lut = np.tile(values[:, None], (1, channels))  # extra channels (alpha) pass through
+            lut[:, 0] = np.minimum(values * (1.0 + 0.8 * intensity) + 80 * intensity, 255)  # Enhance Blue
+            lut[:, 1] = values * (1.0 - 0.7 * intensity)  # Reduce Green  
+            lut[:, 2] = values * (1.0 - 0.7 * intensity)  # Reduce Red
             
             # Convert back to uint8
-            tinted.img = img_float.astype(np.uint8)
+            tinted.img = cv2.LUT(tinted.img, lut.astype(np.uint8).reshape(1, 256, channels))
             return tinted
         else:
             return self.copy()
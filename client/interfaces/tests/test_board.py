@@ -253,5 +253,22 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(deep_copied_board.cell_H_pix, original_board.cell_H_pix)
         self.assertEqual(deep_copied_board.W_cells, original_board.W_cells)
 
+    def test_clone_and_reset_copy_pixels(self):
+        """🧪 Test clone copies pixels and reset_board restores them in place"""
+        import numpy as np
+        real_img = Img()
+        real_img.img = np.zeros((16, 16, 3), dtype=np.uint8)
+        board = Board(cell_H_pix=2, cell_W_pix=2, W_cells=8, H_cells=8, img=real_img)
+        
+        cloned = board.clone()
+        self.assertIsNot(cloned.img.img, board.img.img)
+        self.assertTrue(np.array_equal(cloned.img.img, board.img.img))
+        
+        buffer = board.img.img
+        buffer[:] = 255
+        board.reset_board()
+        self.assertIs(board.img.img, buffer)
+        self.assertEqual(int(board.img.img.max()), 0)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
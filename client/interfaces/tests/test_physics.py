@@ -17,6 +17,7 @@ import sys
 import os
 from unittest.mock import Mock, patch
 import time
+import random
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -341,5 +342,47 @@ class TestPhysics(unittest.TestCase):
         self.assertGreater(Physics.SLIDE_CELLS_PER_SEC, 0)
         self.assertIsInstance(Physics.SLIDE_CELLS_PER_SEC, float)
 
+    def test_advanced_position_matches_fresh_calculation(self):
+        """🧪 Test the position kept by advance_movement against an uncached calculation"""
+        def expected_pixel(physics, now):
+            cell = physics.current_cell
+            if physics.is_moving and physics.move_duration > 0:
+                progress = max(0, min(physics.move_duration, now - physics.move_start_time)) / physics.move_duration
+                target = physics.target_cell
+                return (int(cell[1] * 64 + (target[1] - cell[1]) * 64 * progress),
+                        int(cell[0] * 64 + (target[0] - cell[0]) * 64 * progress))
+            return (cell[1] * 64, cell[0] * 64)
+
+        rng = random.Random(1234)
+        physics = Physics(self.start_cell, self.mock_board, 1.0)
+        now = 0
+        for _ in range(2000):
+            action = rng.randrange(5)
+            if action == 0:
+                target = (rng.randrange(8), rng.randrange(8))
+                physics.reset(Command.create_move_command(now, "PW60", physics.current_cell, target))
+            elif action == 1:
+                physics.reset(Command.create_jump_command(now, "PW60", physics.current_cell, physics.current_cell))
+            elif action == 2:
+                # Direct writes between the state update and the draw, as network sync does
+                physics.advance_movement(now)
+                physics.current_cell = (rng.randrange(8), rng.randrange(8))
+                physics.target_cell = (rng.randrange(8), rng.randrange(8))
+                physics.is_moving = rng.random() < 0.5
+            else:
+                now += rng.randrange(0, 400)
+                pixel, _ = physics.advance_movement(now)
+                self.assertEqual(pixel, expected_pixel(physics, now))
+            self.assertEqual(physics.get_current_pixel_position(now), expected_pixel(physics, now))
+
+    def test_setter_write_drops_advanced_position(self):
+        """🧪 Test that moving a piece directly after advance_movement is seen at the same tick"""
+        physics = Physics((2, 2), self.mock_board, 1.0)
+        self.assertEqual(physics.advance_movement(1000), ((128, 128), False))
+
+        physics.current_cell = (5, 3)
+
+        self.assertEqual(physics.get_current_pixel_position(1000), (3 * 64, 5 * 64))
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
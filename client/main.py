@@ -8,8 +8,8 @@ def main():
         pygame.init()
         pygame.display.init()
         
-        begin_image = pygame.image.load("client/pictures/begin.jpg")
         screen = pygame.display.set_mode((1024, 768))
+        begin_image = pygame.image.load("client/pictures/begin.jpg").convert()
         pygame.display.set_caption("🎮 Chess Game Starting...")
         
         # Scale and center image
@@ -63,10 +63,15 @@ def main():
 
     from MoveLogger import MoveLogger
 
+    # Move rules are read-only, so every piece of a type shares one Moves and its tables
+    moves_by_piece_type = {}
+
     def create_piece_states(cell, row_idx, col_idx, board):
         """Create all states for a piece."""
-        moves_path = pathlib.Path(f"shared/pieces/{cell}/moves.txt")
-        moves = Moves(moves_path, (8, 8))
+        moves = moves_by_piece_type.get(cell)
+        if moves is None:
+            moves_path = pathlib.Path(f"shared/pieces/{cell}/moves.txt")
+            moves = moves_by_piece_type[cell] = Moves(moves_path, (8, 8))
         
         # Create graphics for all states
         states_path = pathlib.Path(f"shared/pieces/{cell}/states")
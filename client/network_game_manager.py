@@ -13,6 +13,7 @@ sys.path.append(str(base_path / "client" / "interfaces"))
 sys.path.append(str(base_path / "shared" / "interfaces"))
 
 from Game import Game
+from Command import Command
 from EventBus import EventBus
 from EventTypes import MOVE_DONE, PIECE_CAPTURED, GAME_STARTED, GAME_ENDED, INVALID_MOVE
 from websocket_client import ChessWebSocketClient
@@ -146,11 +147,11 @@ class NetworkGameManager:
                     
                     # Find and update the piece locally
                     for p in self.game.pieces.values():
-                        current_pos = tuple(p.current_state.physics.current_board_cell)
+                        current_pos = p.current_state.physics.current_board_cell
                         if current_pos == from_pos_tuple:
-                            p.current_state.physics.current_board_cell = list(to_pos_tuple)
-                            p.current_state.physics.target_board_cell = list(to_pos_tuple)
-                            p.current_state.physics.is_currently_moving = False
+                            p.current_state.physics.current_cell = to_pos_tuple
+                            p.current_state.physics.target_cell = to_pos_tuple
+                            p.current_state.physics.is_moving = False
                             break
                     
                     print(f"📤 Applied your move: {from_pos} → {to_pos}")
@@ -234,8 +235,8 @@ class NetworkGameManager:
             all_selections = self.game.input_manager.get_all_selections()
             for player, sel in all_selections.items():
                 selections[player] = {
-                    'pos': sel['pos'],
-                    'selected_piece_id': sel['selected'].piece_id if sel['selected'] else None,
+                    'pos': sel.pos,
+                    'selected_piece_id': sel.selected.piece_id if sel.selected else None,
                     'last_update': self.game.game_time_ms()
                 }
             
@@ -472,7 +473,6 @@ class NetworkGameManager:
         cmd_params = state_data.get('command_params', [])
             
         # Create command with state timing
-        from shared.interfaces.Command import Command
         state_cmd = Command(state_info['activation_time'], piece.piece_id, cmd_type, cmd_params)
         
         # Use state machine to transition
@@ -517,7 +517,7 @@ class NetworkGameManager:
             
         # Update movement state
         if 'is_moving' in state_data:
-            piece.current_state.physics.is_currently_moving = state_data['is_moving']
+            piece.current_state.physics.is_moving = state_data['is_moving']
             
         # Log state changes for debugging
         if 'state' in state_data and old_state != state_data['state']:
@@ -584,12 +584,12 @@ class NetworkGameManager:
                 if piece_data.get('is_moving', False):
                     target_pos = piece_data.get('target_position')
                     if target_pos:
-                        piece.current_state.physics.target_board_cell = tuple(target_pos)                    # Log state changes
+                        piece.current_state.physics.target_cell = tuple(target_pos)                    # Log state changes
                     self._log_piece_update(piece_id, old_pos, new_pos, piece_data)
                     if old_state != piece.current_state.current_state_name:
                         logger.info(f"State changed: {old_state} → {piece.current_state.current_state_name}")
-                    piece.current_state.physics.target_board_cell = tuple(piece_data['target_position'])
-                    piece.current_state.physics.is_currently_moving = piece_data['is_moving']
+                    piece.current_state.physics.target_cell = tuple(piece_data['target_position'])
+                    piece.current_state.physics.is_moving = piece_data['is_moving']
                     
                     # Update board state if position changed
                     if old_pos != new_pos:
@@ -855,16 +855,16 @@ class NetworkGameManager:
             # Find the piece at the source position
             piece_to_move = None
             for piece in self.game.pieces.values():
-                current_pos = tuple(piece.current_state.physics.current_board_cell)
+                current_pos = piece.current_state.physics.current_board_cell
                 if current_pos == from_pos:
                     piece_to_move = piece
                     break
             
             if piece_to_move:
                 # Update the piece's position directly
-                piece_to_move.current_state.physics.current_board_cell = list(to_pos)
-                piece_to_move.current_state.physics.target_board_cell = list(to_pos)
-                piece_to_move.current_state.physics.is_currently_moving = False
+                piece_to_move.current_state.physics.current_cell = to_pos
+                piece_to_move.current_state.physics.target_cell = to_pos
+                piece_to_move.current_state.physics.is_moving = False
                 
                 print(f"✅ Applied opponent move: {piece_to_move.piece_id} to {to_pos}")
             else:
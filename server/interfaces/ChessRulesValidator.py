@@ -2,6 +2,9 @@
 Chess Rules Validation - Validates chess movements and game mechanics
 """
 
+# Row step of a forward pawn move for each color (anything else moves like Black)
+_PAWN_DIRECTION = {"White": -1, "Black": 1}
+
 
 class ChessGameRulesValidator:
     """Validates chess movements according to official rules."""
@@ -50,20 +53,17 @@ class ChessGameRulesValidator:
         row_diff = target_pos[0] - start_pos[0]
         col_diff = abs(target_pos[1] - start_pos[1])
         
-        expected_direction = -1 if pawn.color == "White" else 1
+        expected_direction = _PAWN_DIRECTION.get(pawn.color, 1)
         
         # Diagonal capture
         if target_piece:
             return col_diff == 1 and row_diff == expected_direction
         
-        # Forward movement
-        if col_diff == 0:
-            if row_diff == expected_direction:
-                return True
-            elif row_diff == 2 * expected_direction and not pawn.movement_tracker.has_moved:
-                return True
-        
-        return False
+        # Forward movement: one step, or two steps on the pawn's first move
+        return col_diff == 0 and (
+            row_diff == expected_direction
+            or (row_diff == 2 * expected_direction and not pawn.movement_tracker.has_moved)
+        )
 
 # Backward compatibility alias
 ChessRulesValidator = ChessGameRulesValidator
@@ -2,49 +2,62 @@
 CollisionManager - Manages piece collisions and captures
 Handles all logic related to piece collisions, captures, and movement blocking
 """
+from collections import defaultdict
 from typing import Dict, List
 from Piece import Piece
-from Command import Command
+from Command import Command, CommandType
 
 class CollisionManager:
     def __init__(self, event_bus=None):
         self.event_bus = event_bus
 
-    def group_pieces_by_position(self, pieces: Dict[str, Piece], get_time_func) -> Dict[tuple, List[Piece]]:
+    def group_pieces_by_position(self, pieces: Dict[str, Piece], get_time_func, now_ms: int = None) -> Dict[tuple, List[Piece]]:
         """Group all pieces by their current position."""
-        positions: Dict[tuple, List[Piece]] = {}
-        now = get_time_func()
+        positions: Dict[tuple, List[Piece]] = defaultdict(list)
+        now = get_time_func() if now_ms is None else now_ms
 
         for piece in pieces.values():
-            pos = piece.current_state.physics.get_current_pixel_position(now)
-            if pos not in positions:
-                positions[pos] = []
-            positions[pos].append(piece)
+            positions[piece.current_state.physics.get_current_pixel_position(now)].append(piece)
         
         return positions
 
     def resolve_cell_collision(self, pieces: List[Piece], captured_pieces: List[Piece]):
         """Resolve collision between pieces in a single cell."""
-        pieces_by_color = {
-            "White": [p for p in pieces if p.color == "White"],
-            "Black": [p for p in pieces if p.color == "Black"]
-        }
+        # Split by color and by motion in a single pass: color -> (stationary, moving)
+        # Motion is evaluated once per piece and reused by the enemy collision check
+        # unless a friendly collision blocked some of the pieces in the meantime.
+        pieces_by_color = {"White": ([], []), "Black": ([], [])}
+        motion_flags = []
+        for piece in pieces:
+            in_motion = self.is_piece_in_motion(piece)
+            motion_flags.append(in_motion)
+            groups = pieces_by_color.get(piece.color)
+            if groups is not None:
+                stationary, moving = groups
+                (moving if in_motion else stationary).append(piece)
         
         # Handle same-color collisions
-        for color_group in pieces_by_color.values():
-            if len(color_group) > 1:
-                self.handle_friendly_collision(color_group)
+        for stationary, moving in pieces_by_color.values():
+            if len(stationary) + len(moving) > 1:
+                self.handle_friendly_collision(stationary or moving, stationary, moving)
+                motion_flags = None
         
         # Handle different-color collisions
-        if pieces_by_color["White"] and pieces_by_color["Black"]:
-            self.handle_enemy_collision(pieces, captured_pieces)
+        if any(pieces_by_color["White"]) and any(pieces_by_color["Black"]):
+            self.handle_enemy_collision(pieces, captured_pieces, motion_flags)
 
-    def handle_friendly_collision(self, same_color_pieces):
+    def is_piece_in_motion(self, piece) -> bool:
+        """Check whether a piece is moving or in a move/jump state."""
+        state = piece.current_state
+        return state.physics.is_moving or state.state in ("move", "jump")
+
+    def handle_friendly_collision(self, same_color_pieces, stationary_pieces=None, moving_pieces=None):
         """Handle collision between pieces of the same color."""
-        # Keep stationary pieces, block moving pieces
-        stationary_pieces = [p for p in same_color_pieces if not p.current_state.physics.is_moving and p.current_state.state not in ["move", "jump"]]
-        moving_pieces = [p for p in same_color_pieces if p.current_state.physics.is_moving or p.current_state.state in ["move", "jump"]]
+        if stationary_pieces is None or moving_pieces is None:
+            stationary_pieces = [p for p in same_color_pieces if not self.is_piece_in_motion(p)]
+            moving_pieces = [p for p in same_color_pieces if self.is_piece_in_motion(p)]
         
+        # Keep stationary pieces, block moving pieces
         if stationary_pieces and moving_pieces:
             # Block moving pieces
             for moving_piece in moving_pieces:
@@ -56,22 +69,25 @@ class CollisionManager:
 
     def block_piece_movement(self, piece, get_time_func=None):
         """Block a piece's movement and return it to idle."""
-        piece.current_state.physics.target_cell = piece.current_state.physics.current_cell
-        piece.current_state.physics.is_moving = False
+        physics = piece.current_state.physics
+        physics.target_cell = physics.current_cell
+        physics.is_moving = False
         if get_time_func:
             now = get_time_func()
-            idle_cmd = Command(timestamp=now, piece_id=piece.piece_id, type="idle", params=[])
+            idle_cmd = Command(timestamp=now, piece_id=piece.piece_id, type=CommandType.IDLE, params=[])
             piece.handle_command(idle_cmd, now)
 
-    def handle_enemy_collision(self, pieces_in_cell, to_remove):
+    def handle_enemy_collision(self, pieces_in_cell, to_remove, motion_flags=None):
         """Handle collision between pieces of different colors."""
+        if motion_flags is None:
+            motion_flags = [self.is_piece_in_motion(p) for p in pieces_in_cell]
+        
         # Find attacker (moving piece) vs defender (stationary piece)
         attacking_piece = None
         defending_piece = None
         
-        for piece in pieces_in_cell:
-            if (piece.current_state.physics.is_moving or 
-                piece.current_state.state in ["move", "jump"]):
+        for piece, in_motion in zip(pieces_in_cell, motion_flags):
+            if in_motion:
                 attacking_piece = piece
             else:
                 defending_piece = piece
@@ -79,8 +95,7 @@ class CollisionManager:
         # If unclear, use most recent action time
         if not attacking_piece and len(pieces_in_cell) >= 2:
             if hasattr(pieces_in_cell[0], 'cooldown_system'):
-                attacking_piece = max(pieces_in_cell, key=lambda p: getattr(p.cooldown_system, 'last_action_time', 0))
-                defending_piece = min(pieces_in_cell, key=lambda p: getattr(p.cooldown_system, 'last_action_time', 0))
+                attacking_piece, defending_piece = self.find_latest_and_earliest_actors(pieces_in_cell)
             else:
                 attacking_piece, defending_piece = pieces_in_cell[0], pieces_in_cell[1]
         
@@ -88,6 +103,18 @@ class CollisionManager:
         if defending_piece and attacking_piece != defending_piece:
             to_remove.append(defending_piece)
 
+    def find_latest_and_earliest_actors(self, pieces):
+        """Return the pieces with the latest and earliest last action time in one pass."""
+        latest = earliest = pieces[0]
+        latest_time = earliest_time = getattr(latest.cooldown_system, 'last_action_time', 0)
+        for piece in pieces[1:]:
+            action_time = getattr(piece.cooldown_system, 'last_action_time', 0)
+            if action_time > latest_time:
+                latest, latest_time = piece, action_time
+            elif action_time < earliest_time:
+                earliest, earliest_time = piece, action_time
+        return latest, earliest
+
     def remove_captured_pieces(self, pieces_dict: Dict[str, Piece], captured_pieces: List[Piece]):
         """Remove captured pieces and notify event bus."""
         for piece in captured_pieces:
@@ -95,9 +122,17 @@ class CollisionManager:
                 self.event_bus.publish("PIECE_CAPTURED", {"piece": piece})
             del pieces_dict[piece.piece_id]
 
-    def resolve_collisions(self, pieces_dict: Dict[str, Piece], get_time_func):
-        """Resolve piece collisions and captures based on chess-like rules."""
-        piece_positions = self.group_pieces_by_position(pieces_dict, get_time_func)
+    def resolve_collisions(self, pieces_dict: Dict[str, Piece], get_time_func, now_ms: int = None,
+                           piece_positions: Dict[tuple, List[Piece]] = None) -> List[Piece]:
+        """Resolve piece collisions and captures; return the pieces that were captured.
+
+        piece_positions may be passed in when the caller already grouped the pieces.
+        """
+        if len(pieces_dict) < 2:
+            return []
+
+        if piece_positions is None:
+            piece_positions = self.group_pieces_by_position(pieces_dict, get_time_func, now_ms)
         captured_pieces = []
 
         for pieces_in_cell in piece_positions.values():
@@ -105,3 +140,4 @@ class CollisionManager:
                 self.resolve_cell_collision(pieces_in_cell, captured_pieces)
 
         self.remove_captured_pieces(pieces_dict, captured_pieces)
+        return captured_pieces
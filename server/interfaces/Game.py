@@ -1,10 +1,11 @@
 import pygame
-import queue, threading, time, math
+import queue, threading, time, math, weakref
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple, Optional
 from Board import Board
-from Command import Command
+from Command import Command, CommandType
 from Piece import Piece
 from img import Img
 from GameUI import GameUI
@@ -19,22 +20,32 @@ from EventTypes import GAME_STARTED, GAME_ENDED, MOVE_DONE, PIECE_CAPTURED, PAWN
 class InvalidBoard(Exception): ...
 # ────────────────────────────────────────────────────────────────────
 class Game:
+    # Main loop rate; events are pumped, commands drained and the screen drawn once per frame
+    TARGET_FPS = 30
+
     def __init__(self, pieces: List[Piece], board: Board, event_bus=None, score_manager=None, move_logger=None):
         """Initialize the game with pieces, board, and optional event bus and managers."""
         # Core game components
         self.pieces = {p.piece_id: p for p in pieces}
+        self._kings = {p.piece_id: p for p in pieces if p.piece_type == "K"}
         self.board = board
-        self.start_time = time.time()
+        self.start_time = time.time()  # wall clock, for the on-screen and final durations
+        # Game time (command timestamps, physics, animation) runs on the monotonic clock
+        self._start_monotonic_ns = time.monotonic_ns()
         
         # Event handling and game state
         self.user_input_queue = queue.Queue()
         self.event_bus = event_bus
         self._should_quit = False
+        # Set whenever pieces may have changed position; collisions are only checked then
+        self._motion_dirty = True
         
         # Game managers
         self.score_manager = score_manager
         self.move_logger = move_logger
         self.statistics_manager = StatisticsManager()
+        # Live stats are printed off the main loop so they don't stall rendering
+        self._stats_executor = ThreadPoolExecutor(max_workers=1)
         self.input_manager = ThreadedInputManager(board, self.user_input_queue, event_bus, debug=True)
         self.promotion_manager = PromotionManager(board)
         self.collision_manager = CollisionManager(event_bus)
@@ -50,16 +61,18 @@ class Game:
         self.board_height = self.board.H_cells * self.cell_height
         self.window_width = self.board_width + (2 * self.info_panel_width)
         self.window_height = self.board_height
-        
+
         # Initialize pygame and UI components
         self._init_pygame_window()
+        self._init_board_surface()
+        self._preconvert_sprites()
         self.ui = GameUI(self.info_panel_width)
         self.promotion_ui = PromotionUI(self.window_width, self.window_height)
 
     # ─── helpers ─────────────────────────────────────────────────────────────
     def game_time_ms(self) -> int:
         """Return the current game time in milliseconds."""
-        return int((time.time() - self.start_time) * 1000)
+        return (time.monotonic_ns() - self._start_monotonic_ns) // 1_000_000
 
     def _init_pygame_window(self):
         """Initialize pygame and create the main window."""
@@ -69,6 +82,61 @@ class Game:
         pygame.display.set_caption("Kung Fu Chess")
         self.clock = pygame.time.Clock()
 
+    def _init_board_surface(self):
+        """Convert the static board background to a surface once and set up the board area."""
+        board_pixels = self.board.img.img
+        height, width = board_pixels.shape[:2]
+        self._bg_surface = self._img_to_surface(board_pixels)
+        # The board is drawn straight into its region of the window; a subsurface
+        # keeps board-relative coordinates and clipping without an extra copy
+        self._board_rect = pygame.Rect(self.info_panel_width, 0, width, height)
+        self._board_surface = self.screen.subsurface(self._board_rect)
+        # Next frame must present the whole window (first frame, or after an overlay)
+        self._full_redraw = True
+        # One Rect per board cell for the selection highlights, indexed [row][col]
+        self._cell_rects = [
+            [pygame.Rect(col * self.cell_width, row * self.cell_height, self.cell_width, self.cell_height)
+             for col in range(self.board.W_cells)]
+            for row in range(self.board.H_cells)
+        ]
+        # Sprite frames (and their cached tints) are long-lived Img objects shared
+        # between pieces, so their converted surfaces are cached per image; entries
+        # drop automatically if an image is ever discarded
+        self._sprite_surfaces = weakref.WeakKeyDictionary()
+
+    def _sprite_surface(self, sprite: Img) -> pygame.Surface:
+        """Return the display-format surface for a sprite image, converting it on first use."""
+        surface = self._sprite_surfaces.get(sprite)
+        if surface is None:
+            surface = self._img_to_surface(sprite.img)
+            self._sprite_surfaces[sprite] = surface
+        return surface
+
+    def _preconvert_sprites(self):
+        """Convert every sprite frame reachable from the pieces' states at load time,
+        so the first frame of each animation doesn't pay for the conversion mid-game."""
+        seen_states = set()
+        for piece in self.pieces.values():
+            pending = [piece.current_state]
+            while pending:
+                state = pending.pop()
+                if id(state) in seen_states:
+                    continue
+                seen_states.add(id(state))
+                for frame in state.graphics.frames:
+                    if frame.img is not None:
+                        self._sprite_surface(frame)
+                pending.extend(state.transitions.values())
+
+    @staticmethod
+    def _img_to_surface(pixels: np.ndarray) -> pygame.Surface:
+        """Build a display-format pygame surface from a BGR or BGRA OpenCV image."""
+        # frombuffer reads OpenCV's row-major BGR(A) layout as-is - no transpose or
+        # channel swap - and convert() makes the single copy the surface keeps
+        height, width, channels = pixels.shape
+        pixel_format = "BGRA" if channels == 4 else "BGR"
+        return pygame.image.frombuffer(np.ascontiguousarray(pixels), (width, height), pixel_format).convert()
+
     def clone_board(self) -> Board:
         """
         Return a **brand-new** Board wrapping a copy of the background pixels
@@ -76,65 +144,73 @@ class Game:
         """
         return self.board.clone()
 
-    def _draw(self):
-        """Draw the current game state with info panel."""
-        # Clear screen with black background
-        self.screen.fill((0, 0, 0))
+    def _draw(self, now_ms: int = None, pieces=None):
+        """Draw the current game state with info panel.
+
+        While collisions are pending, returns the drawn pieces grouped by pixel
+        position so capture resolution can reuse them; otherwise returns None.
+        """
+        if now_ms is None:
+            now_ms = self.game_time_ms()
+        if pieces is None:
+            pieces = self.pieces.values()
         
-        # Draw game board
-        board_img = self.clone_board().img
-        for piece in self.pieces.values():
-            piece.render_piece_on_board(board_img, self.game_time_ms())
+        # No full-screen clear: the board and the two panels repaint the whole window
+        
+        # Draw game board: the pre-converted background, then each piece's sprite.
+        # Group by position in the same pass when _resolve_collisions will need it.
+        piece_positions = {} if self._motion_dirty else None
+        pygame_surface = self._board_surface
+        pygame_surface.blit(self._bg_surface, (0, 0))
+        for piece in pieces:
+            position = piece.get_current_position(now_ms)
+            if piece_positions is not None:
+                piece_positions.setdefault(position, []).append(piece)
+            sprite = piece.get_current_sprite(now_ms)
+            if sprite.img is not None:
+                pygame_surface.blit(self._sprite_surface(sprite), position)
         
         # Get player selections once
         selection = self.input_manager.get_all_selections()
 
-# Convert board image to RGB for pygame
-        
-        # Handle both BGR and BGRA images
-        if board_img.img.shape[2] == 4:
-            img_rgb = cv2.cvtColor(board_img.img, cv2.COLOR_BGRA2RGB)
-        else:
-            img_rgb = cv2.cvtColor(board_img.img, cv2.COLOR_BGR2RGB)
-            
-        # Create pygame surface with proper orientation
-        pygame_surface = pygame.surfarray.make_surface(img_rgb.swapaxes(0, 1))
-
 # draw the selection rectangles
         for player in ['A', 'B']:
-            pos = selection[player]['pos']
-            color = selection[player]['color']
-            rect = pygame.Rect(pos[1] * self.cell_width, pos[0] * self.cell_height,
-                               self.cell_width, self.cell_height)
-            pygame.draw.rect(pygame_surface, color, rect, 3)
-            selected_piece = selection[player]['selected']
+            player_selection = selection[player]
+            pos = player_selection.pos
+            color = player_selection.color
+            pygame.draw.rect(pygame_surface, color, self._cell_rects[pos[0]][pos[1]], 3)
+            selected_piece = player_selection.selected
             if selected_piece:
                 p_pos = selected_piece.current_state.physics.current_cell
-                rect2 = pygame.Rect(p_pos[1] * self.cell_width, p_pos[0] * self.cell_height,
-                                    self.cell_width, self.cell_height)
-                pygame.draw.rect(pygame_surface, color, rect2, 5)
+                pygame.draw.rect(pygame_surface, color, self._cell_rects[p_pos[0]][p_pos[1]], 5)
 
-# showing the board in the center of the screen
-        board_x_offset = self.info_panel_width  
-        self.screen.blit(pygame_surface, (board_x_offset, 0))
-        
-# draw the data with GameUI
-        self.ui.draw_player_panels(self.screen, self.board_width, self.window_height, 
-                                  self.pieces, selection, self.start_time, 
-                                  self.score_manager, self.move_logger)
+# draw the data with GameUI; panels whose content is unchanged are skipped
+        panel_rects = self.ui.draw_player_panels(self.screen, self.board_width, self.window_height, 
+                                                self.pieces, selection, self.start_time, 
+                                                self.score_manager, self.move_logger,
+                                                force=self._full_redraw)
         
         # Draw promotion popup if active for any player
+        popup_drawn = False
         for player in ['A', 'B']:
             promotion_state = self.input_manager.get_promotion_state(player)
-            if promotion_state['active']:
+            if promotion_state.active:
                 self.promotion_ui.draw_promotion_popup(
                     self.screen, 
                     player, 
-                    promotion_state['menu_selection'], 
+                    promotion_state.menu_selection, 
                     self.input_manager.promotion_options
                 )
+                popup_drawn = True
         
-        pygame.display.flip()
+        # Present only what changed: the board plus any repainted panel. The popup
+        # overlay dims the whole window, so it (and the frame after it) goes full-screen.
+        if popup_drawn or self._full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update([self._board_rect] + panel_rects)
+        self._full_redraw = popup_drawn
+        return piece_positions
 
     # ─── main public entrypoint ──────────────────────────────────────────────
     def run(self):
@@ -162,52 +238,64 @@ class Game:
         print("Started threaded input manager")
 
         # ─────── main loop ──────────────────────────────────────────────────
-        while not self._is_win() and not self._should_quit:
-            now = self.game_time_ms()
-
-            # (0) Update network manager if present
-            if self.network_manager:
-                self.network_manager.update()
-
-            # (1) Update physics & animations
-            for p in self.pieces.values():
-                p.update_piece_state(now)
-
-            # (1.5) Handle pygame QUIT events (window close button)
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self._should_quit = True
-
-            # (2) Handle queued Commands from input thread
-            while not self.user_input_queue.empty():
-                cmd: Command = self.user_input_queue.get()
-                
-                # Handle system commands
-                if cmd.piece_id == "SYSTEM":
-                    if cmd.type == "QUIT":
+        # The stats worker must not outlive a loop that raised
+        try:
+            while not self._is_win() and not self._should_quit:
+                now = self.game_time_ms()
+
+                # (0) Update network manager if present
+                if self.network_manager:
+                    self.network_manager.update()
+                    self._motion_dirty = True  # remote state sync can move pieces directly
+
+                # Snapshot the pieces once per frame; captures mutate self.pieces later on
+                pieces_snapshot = tuple(self.pieces.values())
+
+                # (1) Update physics & animations
+                for p in pieces_snapshot:
+                    # Checked before updating so the frame a move completes still counts
+                    if p.current_state.physics.is_moving:
+                        self._motion_dirty = True
+                    p.update_piece_state(now)
+
+                # (1.5) Handle pygame QUIT events (window close button) - once per frame, the
+                # loop is paced by clock.tick so SDL is never pumped faster than TARGET_FPS
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
                         self._should_quit = True
-                        continue
-                    elif cmd.type == "SHOW_STATS":
-                        self.statistics_manager.display_live_statistics(self.pieces, self.start_time)
-                        continue
+
+                # (2) Handle queued Commands from input thread
+                for cmd in self._drain_input_queue():
+                    # Handle system commands
+                    if cmd.piece_id == "SYSTEM":
+                        if cmd.type == CommandType.QUIT:
+                            self._should_quit = True
+                            continue
+                        elif cmd.type == CommandType.SHOW_STATS:
+                            self._stats_executor.submit(self.statistics_manager.display_live_statistics,
+                                                        dict(self.pieces), self.start_time)
+                            continue
                 
-                # Handle game commands
-                if cmd.type == "Promotion":
-                    self._handle_promotion_command(cmd)
-                else:
-                    self._process_input(cmd)
+                    # Handle game commands
+                    if cmd.type == CommandType.PROMOTION:
+                        self._handle_promotion_command(cmd)
+                        pieces_snapshot = tuple(self.pieces.values())  # promotion swaps a piece
+                    else:
+                        self._process_input(cmd, now)
                 
-                if self.event_bus:
-                    self.event_bus.publish(MOVE_DONE, {"command": cmd})
+                    if self.event_bus:
+                        self.event_bus.publish(MOVE_DONE, {"command": cmd})
 
-            # (3) Draw current position
-            self._draw()
+                # (3) Draw current position
+                piece_positions = self._draw(now, pieces_snapshot)
 
-            # (4) Detect captures
-            self._resolve_collisions()
+                # (4) Detect captures, reusing the positions gathered while drawing
+                self._resolve_collisions(now, piece_positions)
 
 
-            self.clock.tick(30)
+                self.clock.tick(self.TARGET_FPS)
+        finally:
+            self._stats_executor.shutdown(wait=False)
 
         # ═══════════ STOP THREADED INPUT MANAGER ═══════════
         self.input_manager.stop_listening()
@@ -227,36 +315,57 @@ class Game:
         pygame.quit()
 
     # ─── drawing helpers ────────────────────────────────────────────────────
-    def _process_input(self, cmd: Command):
+    def _drain_input_queue(self) -> List[Command]:
+        """Take every queued command under a single acquisition of the queue lock."""
+        input_queue = self.user_input_queue
+        with input_queue.mutex:
+            if not input_queue.queue:
+                return []
+            commands = list(input_queue.queue)
+            input_queue.queue.clear()
+            input_queue.not_full.notify_all()
+        return commands
+
+    def _process_input(self, cmd: Command, now_ms: int = None):
         """Process player input commands."""
-        if cmd.piece_id in self.pieces:
-            now = self.game_time_ms()
-            piece = self.pieces[cmd.piece_id]
-            piece.handle_command(cmd, now)
-        else:
-            pass  # Piece not found - silently ignore
+        piece = self.pieces.get(cmd.piece_id)
+        if piece is None:
+            return  # Piece not found - silently ignore
+        if now_ms is None:
+            now_ms = self.game_time_ms()
+        piece.handle_command(cmd, now_ms)
+        self._motion_dirty = True
     
 
 
     def _handle_promotion_command(self, cmd: Command):
         """Handle pawn promotion command - replace the piece with a new one."""
         self.promotion_manager.handle_promotion(cmd, self.pieces, self.input_manager, self.game_time_ms)
+        self._motion_dirty = True
     # ─── capture resolution ────────────────────────────────────────────────
-    def _resolve_collisions(self):
+    def _resolve_collisions(self, now_ms: int = None, piece_positions=None):
         """Resolve piece collisions and captures based on chess-like rules."""
-        self.collision_manager.resolve_collisions(self.pieces, self.game_time_ms)
+        # Nothing moved since the last check, so no new collisions are possible
+        if not self._motion_dirty:
+            return
+        self._motion_dirty = False
+        
+        captured_pieces = self.collision_manager.resolve_collisions(self.pieces, self.game_time_ms, now_ms,
+                                                                    piece_positions)
+        for piece in captured_pieces:
+            self._kings.pop(piece.piece_id, None)
 
 
 
     # ─── board validation & win detection ───────────────────────────────────
     def _get_kings(self) -> list:
         """Get all kings currently on the board."""
-        return [p for p in self.pieces.values() if p.piece_type == "K"]
+        return list(self._kings.values())
 
     def _is_win(self) -> bool:
         """Check if the game has ended."""
         # Game ends when one or both kings are captured
-        return len(self._get_kings()) < 2
+        return len(self._kings) < 2
 
     def _announce_win(self):
         """Announce the winner."""
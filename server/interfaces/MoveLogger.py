@@ -1,16 +1,23 @@
 #!/usr/bin/env python3
 """Game Movement History Tracker - Records and displays recent player moves."""
 import time
+from collections import deque
 from typing import Dict, List, Optional, Tuple
+from Command import PLAYER_BY_COLOR_CODE
 
 
 class GameMovementHistoryTracker:
     """Tracks and displays recent moves for both players with timestamps."""
     
     def __init__(self, maximum_moves_to_remember: int = 6):
-        self.player_move_histories = {"A": [], "B": []}
         self.maximum_moves_to_remember = maximum_moves_to_remember
-        self.game_start_time = time.time()
+        self.player_move_histories = self.create_empty_move_histories()
+        # Reference point for elapsed time only; monotonic so clock changes don't skew it
+        self.game_start_time = time.monotonic()
+
+    def create_empty_move_histories(self) -> Dict[str, deque]:
+        # Bounded ring buffers: appending past the limit drops the oldest move in O(1)
+        return {player: deque(maxlen=self.maximum_moves_to_remember) for player in ("A", "B")}
     
     def process_game_event(self, event_type: str, event_data: Dict):
         if event_type == "MOVE_DONE":
@@ -20,7 +27,7 @@ class GameMovementHistoryTracker:
         if not self.is_valid_movement_command(movement_command):
             return
         
-        player_identifier = self.extract_player_from_piece_id(movement_command.piece_id)
+        player_identifier = movement_command.player
         if player_identifier:
             formatted_move_text = self.create_formatted_move_description(movement_command)
             self.add_move_to_player_history(player_identifier, formatted_move_text)
@@ -29,8 +36,7 @@ class GameMovementHistoryTracker:
         return command and hasattr(command, 'piece_id') and len(command.piece_id) >= 2
 
     def extract_player_from_piece_id(self, piece_id: str) -> Optional[str]:
-        color_mapping = {"W": "A", "B": "B"}
-        return color_mapping.get(piece_id[1])
+        return PLAYER_BY_COLOR_CODE.get(piece_id[1])
 
     def create_formatted_move_description(self, command) -> str:
         current_timestamp = time.strftime("%H:%M:%S")
@@ -45,13 +51,13 @@ class GameMovementHistoryTracker:
                 isinstance(command.params[0], tuple) and isinstance(command.params[1], tuple))
 
     def add_move_to_player_history(self, player_identifier: str, move_description: str):
+        # The deque's maxlen keeps the history within maximum_moves_to_remember
         self.player_move_histories[player_identifier].append(move_description)
-        self.maintain_history_size_limit(player_identifier)
 
     def maintain_history_size_limit(self, player_identifier: str):
         history = self.player_move_histories[player_identifier]
         while len(history) > self.maximum_moves_to_remember:
-            history.pop(0)
+            history.popleft()
 
     def record_move_from_console_output(self, console_text_line: str):
         parsed_move_data = self.parse_console_move_line(console_text_line)
@@ -63,27 +69,27 @@ class GameMovementHistoryTracker:
         if not self.is_console_move_line(line):
             return None
             
-        try:
-            player_identifier = "A" if "Player A:" in line else "B"
-            move_text = line.split(": ", 1)[1]
-            current_timestamp = time.strftime("%H:%M:%S")
-            formatted_move = f"[{current_timestamp}] {move_text}"
-            return (player_identifier, formatted_move)
-        except (IndexError, ValueError):
+        player_identifier = "A" if "Player A:" in line else "B"
+        _, separator, move_text = line.partition(": ")
+        if not separator:
             return None
+        current_timestamp = time.strftime("%H:%M:%S")
+        formatted_move = f"[{current_timestamp}] {move_text}"
+        return (player_identifier, formatted_move)
 
     def is_console_move_line(self, line: str) -> bool:
         return "Player A:" in line or "Player B:" in line
 
     def get_recent_moves_for_player(self, player_identifier: str) -> List[str]:
-        return self.player_move_histories.get(player_identifier, [])
+        # A snapshot list: at most maximum_moves_to_remember entries, safe to slice
+        return list(self.player_move_histories.get(player_identifier, ()))
 
     def count_moves_for_player(self, player_identifier: str) -> int:
         return len(self.player_move_histories.get(player_identifier, []))
 
     def reset_all_move_histories(self):
-        self.player_move_histories = {"A": [], "B": []}
-        self.game_start_time = time.time()
+        self.player_move_histories = self.create_empty_move_histories()
+        self.game_start_time = time.monotonic()
     
     # Legacy aliases for backward compatibility
     def update(self, event_type: str, data: Dict):
@@ -1,5 +1,56 @@
+import functools
 import pathlib
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+
+@functools.lru_cache(maxsize=None)
+def build_between_masks(board_height: int, board_width: int) -> Tuple[int, ...]:
+    """Bitmask of the squares strictly between two squares on a shared rank, file or
+    diagonal, flat-indexed [from_square * square_count + to_square]; 0 if not aligned."""
+    square_count = board_height * board_width
+    between_masks = [0] * (square_count * square_count)
+    for from_square in range(square_count):
+        from_row, from_col = divmod(from_square, board_width)
+        for row_step, col_step in ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)):
+            path_mask = 0
+            row, col = from_row + row_step, from_col + col_step
+            while 0 <= row < board_height and 0 <= col < board_width:
+                to_square = row * board_width + col
+                between_masks[from_square * square_count + to_square] = path_mask
+                path_mask |= 1 << to_square
+                row += row_step
+                col += col_step
+    return tuple(between_masks)
+
+
+def parse_movement_line(line: str) -> Tuple[int, int] | None:
+    if not line or line.startswith('#'):
+        return None
+        
+    coordinates_text = line.split(':')[0].strip() if ':' in line else line.strip()
+    
+    if ',' not in coordinates_text:
+        return None
+        
+    try:
+        row_delta, col_delta = map(int, coordinates_text.split(','))
+        return (row_delta, col_delta)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def load_movement_deltas(file_path: str, modified_time: float) -> Tuple[Tuple[int, int], ...]:
+    """Parsed deltas of a moves file; the modification time in the key makes an
+    edited file parse again instead of serving the stale entry."""
+    movement_deltas = []
+    with open(file_path, 'r') as movement_file:
+        for line in movement_file:
+            movement_delta = parse_movement_line(line.strip())
+            if movement_delta:
+                movement_deltas.append(movement_delta)
+    return tuple(movement_deltas)
+
 
 class PieceMovementRules:
     """Manages valid movement patterns for chess pieces from configuration files."""
@@ -8,34 +59,56 @@ class PieceMovementRules:
         self.board_height, self.board_width = board_dimensions
         self.movement_deltas: List[Tuple[int, int]] = []
         self.load_movement_patterns_from_file(movement_file_path)
+        # Set of deltas for constant-time "can this piece reach that square" checks
+        self.movement_delta_set = frozenset(self.movement_deltas)
+        # Per-square bitmask of reachable targets (bit = row * width + col),
+        # so off-board deltas are filtered once here instead of on every query
+        self.target_masks_by_square = self.build_target_masks_by_square()
+        # The same targets as ready-made tuples, so get_moves is a single lookup
+        self.valid_moves_by_square = tuple(
+            self.target_positions_from_mask(target_mask) for target_mask in self.target_masks_by_square
+        )
+        # Shared per board size: squares strictly between two aligned squares
+        self.between_masks = build_between_masks(self.board_height, self.board_width)
 
     def load_movement_patterns_from_file(self, file_path: pathlib.Path):
         if not file_path.exists():
             return
             
-        with open(file_path, 'r') as movement_file:
-            for line in movement_file:
-                movement_delta = self.parse_movement_line(line.strip())
-                if movement_delta:
-                    self.movement_deltas.append(movement_delta)
+        # Each moves file is read and parsed once per process
+        self.movement_deltas.extend(load_movement_deltas(str(file_path), file_path.stat().st_mtime))
 
     def parse_movement_line(self, line: str) -> Tuple[int, int] | None:
-        if not line or line.startswith('#'):
-            return None
-            
-        coordinates_text = line.split(':')[0].strip() if ':' in line else line.strip()
-        
-        if ',' not in coordinates_text:
-            return None
-            
-        try:
-            row_delta, col_delta = map(int, coordinates_text.split(','))
-            return (row_delta, col_delta)
-        except ValueError:
-            return None
+        return parse_movement_line(line)
 
+    def build_target_masks_by_square(self) -> List[int]:
+        target_masks = []
+        for square in range(self.board_height * self.board_width):
+            current_row, current_col = divmod(square, self.board_width)
+            target_mask = 0
+            for row_delta, col_delta in self.movement_deltas:
+                target_row = current_row + row_delta
+                target_col = current_col + col_delta
+                if self.is_position_within_board_bounds(target_row, target_col):
+                    target_mask |= 1 << (target_row * self.board_width + target_col)
+            target_masks.append(target_mask)
+        return target_masks
 
-    def calculate_valid_moves_from_position(self, current_row: int, current_col: int) -> List[Tuple[int, int]]:
+    def target_positions_from_mask(self, target_mask: int) -> Tuple[Tuple[int, int], ...]:
+        # Walk the set bits of the mask, lowest square first
+        target_positions = []
+        while target_mask:
+            lowest_bit = target_mask & -target_mask
+            target_positions.append(divmod(lowest_bit.bit_length() - 1, self.board_width))
+            target_mask ^= lowest_bit
+        return tuple(target_positions)
+
+    def calculate_valid_moves_from_position(self, current_row: int, current_col: int) -> Sequence[Tuple[int, int]]:
+        if self.is_position_within_board_bounds(current_row, current_col):
+            # Precomputed and immutable; callers that need to modify it must copy
+            return self.valid_moves_by_square[current_row * self.board_width + current_col]
+        
+        # Off-board origin: no table entry, apply the deltas directly
         valid_target_positions = []
         
         for row_delta, col_delta in self.movement_deltas:
@@ -47,6 +120,17 @@ class PieceMovementRules:
         
         return valid_target_positions
 
+    def is_target_reachable_from_position(self, start_position, target_position) -> bool:
+        target_row, target_col = target_position
+        if not self.is_position_within_board_bounds(target_row, target_col):
+            return False
+        start_row, start_col = start_position
+        if self.is_position_within_board_bounds(start_row, start_col):
+            # Single bit test against the origin's precomputed target mask
+            target_mask = self.target_masks_by_square[start_row * self.board_width + start_col]
+            return (target_mask >> (target_row * self.board_width + target_col)) & 1 == 1
+        return (target_row - start_row, target_col - start_col) in self.movement_delta_set
+
     def is_position_within_board_bounds(self, row: int, col: int) -> bool:
         return 0 <= row < self.board_height and 0 <= col < self.board_width
 
@@ -54,8 +138,29 @@ class PieceMovementRules:
         if self.can_piece_type_jump_over_obstacles(piece_type):
             return False
         
-        path_squares = self.calculate_path_squares_between_positions(start_position, target_position)
-        return self.any_square_occupied_by_piece(path_squares, all_game_pieces)
+        if not (self.is_position_within_board_bounds(*start_position)
+                and self.is_position_within_board_bounds(*target_position)):
+            path_squares = self.calculate_path_squares_between_positions(start_position, target_position)
+            return self.any_square_occupied_by_piece(path_squares, all_game_pieces)
+        
+        # One AND between the path mask and an occupancy mask of the board
+        board_width = self.board_width
+        start_square = start_position[0] * board_width + start_position[1]
+        target_square = target_position[0] * board_width + target_position[1]
+        path_mask = self.between_masks[start_square * self.board_height * board_width + target_square]
+        if not path_mask:
+            return False  # adjacent squares: nothing in between
+        return (path_mask & self.calculate_occupancy_mask(all_game_pieces)) != 0
+
+    def calculate_occupancy_mask(self, all_game_pieces) -> int:
+        board_width = self.board_width
+        occupancy_mask = 0
+        for piece in all_game_pieces.values():
+            row, col = piece.current_state.physics.current_board_cell
+            # Off-board cells have no bit; shifting by them would fail or alias a square
+            if self.is_position_within_board_bounds(row, col):
+                occupancy_mask |= 1 << (row * board_width + col)
+        return occupancy_mask
 
     def can_piece_type_jump_over_obstacles(self, piece_type: str) -> bool:
         return piece_type == "N"  # Knights can jump over other pieces
@@ -86,11 +191,11 @@ class PieceMovementRules:
         return (row_direction, col_direction)
 
     def any_square_occupied_by_piece(self, squares_to_check, all_game_pieces) -> bool:
-        occupied_positions = {tuple(piece.current_state.physics.current_board_cell) for piece in all_game_pieces.values()}
+        occupied_positions = {piece.current_state.physics.current_board_cell for piece in all_game_pieces.values()}
         return any(square in occupied_positions for square in squares_to_check)
     
     # Legacy aliases for backward compatibility
-    def get_moves(self, r: int, c: int) -> List[Tuple[int, int]]:
+    def get_moves(self, r: int, c: int) -> Sequence[Tuple[int, int]]:
         return self.calculate_valid_moves_from_position(r, c)
     
     def is_path_blocked(self, start_pos, end_pos, piece_type, all_pieces):
@@ -1,22 +1,47 @@
 from typing import Tuple, Optional
-from Command import Command
+from Command import Command, CommandType
 from Board import Board
-import time
+
+
+def build_movement_durations(cells_per_second: float, max_distance: int) -> Tuple[int, ...]:
+    """Slide duration in ms for each Chebyshev distance from 0 to max_distance."""
+    return tuple(int(distance / cells_per_second * 1000) for distance in range(max_distance + 1))
+
 
 class Physics:
     """Manages piece movement physics and position calculations."""
     
+    # Read for every piece on every frame; slots keep those reads off an instance dict
+    __slots__ = ('starting_board_cell', 'current_board_cell', 'target_board_cell', 'game_board',
+                 'movement_speed', 'is_currently_moving', 'movement_start_time', 'movement_duration_ms',
+                 '_resting_cell', '_resting_pixel', '_path_cells', '_path_pixels',
+                 '_advanced_time_ms', '_advanced_pixel')
+    
     MOVEMENT_SPEED_CELLS_PER_SECOND = 4.0
+    # Covers boards up to 16 cells a side; longer slides fall back to the formula
+    MOVEMENT_DURATION_BY_DISTANCE_MS = build_movement_durations(MOVEMENT_SPEED_CELLS_PER_SECOND, 15)
 
     def __init__(self, starting_board_cell: Tuple[int, int], game_board: "Board", movement_speed: float = 1.0):
-        self.starting_board_cell = starting_board_cell
-        self.current_board_cell = starting_board_cell
-        self.target_board_cell = starting_board_cell
+        # Cells are kept as (row, col) tuples so callers can compare and hash them as-is
+        self.starting_board_cell = tuple(starting_board_cell)
+        self.current_board_cell = self.starting_board_cell
+        self.target_board_cell = self.starting_board_cell
         self.game_board = game_board
         self.movement_speed = movement_speed
         self.is_currently_moving = False
         self.movement_start_time = 0
         self.movement_duration_ms = 0
+        # Pixel coordinates cached per cell object; cells may also be replaced from outside
+        # (promotion, network sync), so entries are checked against the current cells by identity
+        self._resting_cell = None
+        self._resting_pixel = None
+        self._path_cells = (None, None)
+        self._path_pixels = None
+        # Position worked out by advance_movement, reused by the draw at the same tick.
+        # Any change to the cells or motion must clear _advanced_time_ms; outside code
+        # goes through the current_cell/target_cell/is_moving setters for that
+        self._advanced_time_ms = None
+        self._advanced_pixel = None
         
     def create_independent_copy(self) -> "Physics":
         independent_physics = Physics(self.starting_board_cell, self.game_board, self.movement_speed)
@@ -28,6 +53,7 @@ class Physics:
         return independent_physics
         
     def execute_command_physics(self, command: Command):
+        self._advanced_time_ms = None
         if self.is_movement_command(command):
             self.start_movement_to_target(command)
         elif self.is_jump_command(command):
@@ -36,13 +62,13 @@ class Physics:
             self.stop_any_current_movement()
     
     def is_movement_command(self, command: Command) -> bool:
-        return command.type == "Move" and command.params
+        return command.type == CommandType.MOVE and command.params
     
     def is_jump_command(self, command: Command) -> bool:
-        return command.type == "Jump" and command.params
+        return command.type == CommandType.JUMP and command.params
     
     def start_movement_to_target(self, command: Command):
-        self.target_board_cell = command.params[1]
+        self.target_board_cell = tuple(command.params[1])
         self.is_currently_moving = True
         self.movement_start_time = command.timestamp
         self.movement_duration_ms = self.calculate_movement_duration()
@@ -60,8 +86,9 @@ class Physics:
         distance_in_rows = abs(self.target_board_cell[0] - self.current_board_cell[0])
         distance_in_cols = abs(self.target_board_cell[1] - self.current_board_cell[1])
         max_distance = max(distance_in_rows, distance_in_cols)
-        duration_ms = int(max_distance / self.MOVEMENT_SPEED_CELLS_PER_SECOND * 1000)
-        return duration_ms
+        if max_distance < len(self.MOVEMENT_DURATION_BY_DISTANCE_MS):
+            return self.MOVEMENT_DURATION_BY_DISTANCE_MS[max_distance]
+        return int(max_distance / self.MOVEMENT_SPEED_CELLS_PER_SECOND * 1000)
 
     def update_movement_state(self, current_time_ms: int) -> bool:
         if not self.is_currently_moving:
@@ -72,6 +99,7 @@ class Physics:
         if elapsed_time >= self.movement_duration_ms:
             self.current_board_cell = self.target_board_cell
             self.is_currently_moving = False
+            self._advanced_time_ms = None
             return True  # Movement just completed
         
         return False  # Movement still in progress
@@ -82,28 +110,48 @@ class Physics:
     def can_piece_capture_others(self) -> bool:
         return not self.is_currently_moving
 
-    def get_current_pixel_position(self, current_time_ms: int = None) -> Tuple[int, int]:
-        if self.is_currently_moving and self.movement_duration_ms > 0:
-            if current_time_ms is None:
-                current_time_ms = int(time.time() * 1000)
-            
+    def advance_movement(self, current_time_ms: int) -> Tuple[Tuple[int, int], bool]:
+        """Land the piece if its movement is over, then return its pixel position and
+        whether it just landed. The position is kept for this tick's draw."""
+        movement_just_finished = self.update_movement_state(current_time_ms)
+        self._advanced_time_ms = None
+        pixel_position = self.get_current_pixel_position(current_time_ms)
+        self._advanced_time_ms = current_time_ms
+        self._advanced_pixel = pixel_position
+        return pixel_position, movement_just_finished
+
+    def get_current_pixel_position(self, current_time_ms: int) -> Tuple[int, int]:
+        # current_time_ms is the game time captured once per loop tick by the caller
+        if current_time_ms == self._advanced_time_ms:
+            return self._advanced_pixel
+        movement_duration_ms = self.movement_duration_ms
+        if self.is_currently_moving and movement_duration_ms > 0:
             elapsed_time = current_time_ms - self.movement_start_time
-            elapsed_time = max(0, min(self.movement_duration_ms, elapsed_time))
-            movement_progress = elapsed_time / self.movement_duration_ms if self.movement_duration_ms > 0 else 1.0
+            elapsed_time = max(0, min(movement_duration_ms, elapsed_time))
+            movement_progress = elapsed_time / movement_duration_ms
 
-            start_pixel_x = self.current_board_cell[1] * self.game_board.cell_W_pix
-            start_pixel_y = self.current_board_cell[0] * self.game_board.cell_H_pix
-            target_pixel_x = self.target_board_cell[1] * self.game_board.cell_W_pix
-            target_pixel_y = self.target_board_cell[0] * self.game_board.cell_H_pix
+            path_cells = self._path_cells
+            if path_cells[0] is not self.current_board_cell or path_cells[1] is not self.target_board_cell:
+                self.cache_movement_path_pixels()
+            start_pixel_x, start_pixel_y, delta_x, delta_y = self._path_pixels
 
-            interpolated_x = int(start_pixel_x + (target_pixel_x - start_pixel_x) * movement_progress)
-            interpolated_y = int(start_pixel_y + (target_pixel_y - start_pixel_y) * movement_progress)
+            return (int(start_pixel_x + delta_x * movement_progress),
+                    int(start_pixel_y + delta_y * movement_progress))
 
-            return (interpolated_x, interpolated_y)
-        else:
-            stationary_x = self.current_board_cell[1] * self.game_board.cell_W_pix
-            stationary_y = self.current_board_cell[0] * self.game_board.cell_H_pix
-            return (stationary_x, stationary_y)
+        if self._resting_cell is not self.current_board_cell:
+            self._resting_cell = self.current_board_cell
+            self._resting_pixel = self.calculate_cell_pixel_position(self.current_board_cell)
+        return self._resting_pixel
+
+    def cache_movement_path_pixels(self):
+        start_pixel_x, start_pixel_y = self.calculate_cell_pixel_position(self.current_board_cell)
+        target_pixel_x, target_pixel_y = self.calculate_cell_pixel_position(self.target_board_cell)
+        self._path_cells = (self.current_board_cell, self.target_board_cell)
+        self._path_pixels = (start_pixel_x, start_pixel_y,
+                             target_pixel_x - start_pixel_x, target_pixel_y - start_pixel_y)
+
+    def calculate_cell_pixel_position(self, board_cell: Tuple[int, int]) -> Tuple[int, int]:
+        return (board_cell[1] * self.game_board.cell_W_pix, board_cell[0] * self.game_board.cell_H_pix)
     
     # Legacy aliases for backward compatibility
     def copy(self):
@@ -115,7 +163,7 @@ class Physics:
     def update(self, current_time_ms):
         return self.update_movement_state(current_time_ms)
     
-    def get_pos(self, current_time_ms=None):
+    def get_pos(self, current_time_ms):
         return self.get_current_pixel_position(current_time_ms)
     
     def can_be_captured(self):
@@ -139,7 +187,8 @@ class Physics:
     
     @current_cell.setter
     def current_cell(self, value):
-        self.current_board_cell = value
+        self.current_board_cell = tuple(value)
+        self._advanced_time_ms = None
     
     @property
     def target_cell(self):
@@ -147,7 +196,8 @@ class Physics:
     
     @target_cell.setter
     def target_cell(self, value):
-        self.target_board_cell = value
+        self.target_board_cell = tuple(value)
+        self._advanced_time_ms = None
     
     @property
     def board(self):
@@ -156,6 +206,7 @@ class Physics:
     @board.setter
     def board(self, value):
         self.game_board = value
+        self._advanced_time_ms = None
     
     @property
     def is_moving(self):
@@ -164,6 +215,7 @@ class Physics:
     @is_moving.setter
     def is_moving(self, value):
         self.is_currently_moving = value
+        self._advanced_time_ms = None
     
     @property
     def move_start_time(self):
@@ -172,6 +224,7 @@ class Physics:
     @move_start_time.setter
     def move_start_time(self, value):
         self.movement_start_time = value
+        self._advanced_time_ms = None
     
     @property
     def move_duration(self):
@@ -180,3 +233,4 @@ class Physics:
     @move_duration.setter
     def move_duration(self, value):
         self.movement_duration_ms = value
+        self._advanced_time_ms = None
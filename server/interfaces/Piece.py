@@ -1,9 +1,24 @@
 from Board import Board
-from Command import Command
+from Command import Command, CommandType
 from State import State
 import cv2
 import numpy as np
 
+
+def build_cooldown_overlay_luts():
+    """Per-channel results of blending 50/50 with yellow (0, 255, 255), taken from
+    cv2.addWeighted itself so the lookup matches its rounding exactly."""
+    channel_values = np.arange(256, dtype=np.uint8).reshape(1, 256)
+    without_yellow = cv2.addWeighted(np.zeros_like(channel_values), 0.5, channel_values, 0.5, 0)
+    with_yellow = cv2.addWeighted(np.full_like(channel_values, 255), 0.5, channel_values, 0.5, 0)
+    return without_yellow.ravel(), with_yellow.ravel()
+
+# Blue channel gets no yellow, green and red get full yellow
+_COOLDOWN_BLUE_LUT, _COOLDOWN_GREEN_RED_LUT = build_cooldown_overlay_luts()
+
+# Piece color for the color code at piece_id[1]
+_COLOR_BY_CODE = {"W": "White", "B": "Black"}
+
 class PieceMovementTracker:
     """Tracks movement history for pieces like pawns with special first-move rules."""
     
@@ -46,6 +61,7 @@ class Piece:
         self.piece_id = piece_id
         self.current_state = initial_state
         self.piece_type = piece_type
+        self.is_pawn = piece_type == "P"  # piece_type is fixed for the piece's lifetime
         self.start_time = 0
         
         self.color = self.extract_color_from_piece_id(piece_id)
@@ -53,10 +69,8 @@ class Piece:
         self.cooldown_system = PieceCooldownSystem()
 
     def extract_color_from_piece_id(self, piece_id: str) -> str:
-        if len(piece_id) < 2:
-            return "Unknown"
-        color_code = piece_id[1]
-        return "White" if color_code == 'W' else "Black" if color_code == 'B' else "Unknown"
+        # The slice is empty for ids shorter than two characters
+        return _COLOR_BY_CODE.get(piece_id[1:2], "Unknown")
 
     def handle_command(self, command: Command, current_time_ms: int):
         if not self.is_command_for_this_piece(command):
@@ -79,13 +93,13 @@ class Piece:
         return not self.cooldown_system.is_action_allowed(current_time_ms)
 
     def is_piece_resting(self) -> bool:
-        return self.current_state.state == "long_rest"
+        return self.current_state.current_state_name == "long_rest"
 
     def is_movement_command(self, command: Command) -> bool:
-        return command.type in ["Move", "Jump"]
+        return command.type in (CommandType.MOVE, CommandType.JUMP)
 
     def is_invalid_pawn_double_move(self, command: Command) -> bool:
-        if self.piece_type != "P" or command.type != "Move":
+        if not self.is_pawn or command.type != CommandType.MOVE:
             return False
         
         move_distance = self.calculate_move_distance(command)
@@ -102,7 +116,7 @@ class Piece:
         previous_state_name = self.current_state.state
         new_state = self.current_state.get_state_after_command(command, current_time_ms)
         
-        if new_state != self.current_state:
+        if new_state is not self.current_state:
             self.current_state = new_state
             self.cooldown_system.record_action(current_time_ms)
             
@@ -121,7 +135,7 @@ class Piece:
 
     def update_piece_state(self, current_time_ms: int):
         updated_state = self.current_state.update(current_time_ms)
-        if updated_state != self.current_state:
+        if updated_state is not self.current_state:
             self.current_state = updated_state
 
     def render_piece_on_board(self, board: Board, current_time_ms: int):
@@ -146,11 +160,11 @@ class Piece:
 
     def draw_cooldown_overlay_if_needed(self, board: Board, piece_position: tuple, current_time_ms: int):
         remaining_cooldown = self.cooldown_system.get_remaining_cooldown(current_time_ms)
-        if remaining_cooldown <= 0:
+        if not remaining_cooldown:
             return
-        
-        cooldown_ratio = remaining_cooldown / self.cooldown_system.cooldown_duration_ms
-        overlay_height = int(board.cell_H_pix * cooldown_ratio)
+        # Integer height: less than one pixel row of cooldown left comes out at 0
+        # and skips the overlay before touching the image
+        overlay_height = board.cell_H_pix * remaining_cooldown // self.cooldown_system.cooldown_duration_ms
         
         if overlay_height > 0 and board.img.img is not None:
             self.apply_yellow_cooldown_overlay(board, piece_position, overlay_height)
@@ -160,7 +174,7 @@ class Piece:
         board_height, board_width = board.img.img.shape[:2]
         
         if y + overlay_height <= board_height and x + board.cell_W_pix <= board_width:
-            overlay_region = board.img.img[y:y + overlay_height, x:x + board.cell_W_pix].copy()
-            yellow_overlay = np.full_like(overlay_region, (0, 255, 255))
-            blended_overlay = cv2.addWeighted(yellow_overlay, 0.5, overlay_region, 0.5, 0)
-            board.img.img[y:y + overlay_height, x:x + board.cell_W_pix] = blended_overlay
+            # Blend in place through the lookup tables: no overlay image, copy or extra pass
+            overlay_region = board.img.img[y:y + overlay_height, x:x + board.cell_W_pix]
+            overlay_region[..., 0] = _COOLDOWN_BLUE_LUT[overlay_region[..., 0]]
+            overlay_region[..., 1:3] = _COOLDOWN_GREEN_RED_LUT[overlay_region[..., 1:3]]
@@ -3,7 +3,7 @@ from typing import Dict, Tuple
 import json
 from Board import Board
 from GraphicsFactory import GraphicsFactory
-from Moves import Moves
+from Moves import Moves, load_movement_deltas
 from PhysicsFactory import PhysicsFactory
 from Piece import Piece
 from State import State
@@ -17,6 +17,8 @@ class PieceFactory:
         self.graphics_factory = GraphicsFactory()
         self.physics_factory = PhysicsFactory(board)
         self.piece_templates: Dict[str, Dict[str, State]] = {}
+        # Pieces with the same moveset (e.g. both queens) share one Moves and its tables
+        self.movement_rules_by_deltas: Dict[Tuple[Tuple[int, int], ...], Moves] = {}
         self.build_all_piece_templates()
     
     def build_all_piece_templates(self):
@@ -46,7 +48,13 @@ class PieceFactory:
     
     def load_movement_rules_from_file(self, piece_directory: pathlib.Path) -> Moves:
         moves_file = piece_directory / "moves.txt"
-        return Moves(moves_file, (self.board.H_cells, self.board.W_cells))
+        movement_deltas = (load_movement_deltas(str(moves_file), moves_file.stat().st_mtime)
+                           if moves_file.exists() else ())
+        movement_rules = self.movement_rules_by_deltas.get(movement_deltas)
+        if movement_rules is None:
+            movement_rules = Moves(moves_file, (self.board.H_cells, self.board.W_cells))
+            self.movement_rules_by_deltas[movement_deltas] = movement_rules
+        return movement_rules
     
     def load_piece_configuration_from_file(self, piece_directory: pathlib.Path) -> dict:
         config_file = piece_directory / "config.json"
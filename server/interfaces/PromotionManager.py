@@ -149,8 +149,8 @@ class PawnPromotionManager:
             return
             
         for player in ['A', 'B']:
-            if input_manager.selection[player]['selected'] == old_piece:
-                input_manager.selection[player]['selected'] = new_piece
+            if input_manager.selection[player].selected == old_piece:
+                input_manager.selection[player].selected = new_piece
                 if self.debug:
                     print(f"Updated {player} selection to new piece {new_piece_id}")
 
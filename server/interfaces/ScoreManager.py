@@ -18,6 +18,8 @@ class ScoreManager:
     
     # Color mappings
     PLAYER_COLOR_MAP = {"A": "White", "B": "Black"}
+    # Color code at index 1 of a piece ID ("PW60" -> White)
+    PIECE_ID_COLOR_MAP = {"W": "White", "B": "Black"}
     
     def __init__(self, custom_piece_values: Optional[Dict[str, int]] = None):
         """Initialize the score manager with optional custom piece values."""
@@ -79,13 +81,7 @@ class ScoreManager:
         """Extract color from piece ID more reliably."""
         if not piece_id:
             return None
-            
-        piece_id_upper = piece_id.upper()
-        if "W" in piece_id_upper:
-            return "White"
-        elif "B" in piece_id_upper:
-            return "Black"
-        return None
+        return self.PIECE_ID_COLOR_MAP.get(piece_id[1:2].upper())
     
     def get_score(self) -> Dict[str, int]:
         """Get current scores."""
@@ -398,5 +398,40 @@ class TestAnimationManager(unittest.TestCase):
         self.assertEqual(self.animation_manager.get_animation_count(), 0)
 
 
+class TestGameAnimationQueue(unittest.TestCase):
+    """Tests for the animation queue against its current API."""
+
+    def setUp(self):
+        self.animation_queue = AnimationManager()
+        self.time_patcher = patch('AnimationManager.time')
+        self.mock_time = self.time_patcher.start()
+        self.mock_time.time.return_value = 1000.0  # Animations start at 1,000,000 ms
+
+    def tearDown(self):
+        self.time_patcher.stop()
+
+    def test_add_remove_by_id_then_update(self):
+        """Test that removing an animation by id leaves the rest updating correctly."""
+        short = self.animation_queue.add_animation("fade_in", 100)
+        removed = self.animation_queue.add_animation("bounce", 200)
+        long = self.animation_queue.add_animation("explosion", 400)
+
+        self.assertTrue(self.animation_queue.remove_animation_by_id(removed["id"]))
+        self.assertFalse(self.animation_queue.remove_animation_by_id(removed["id"]))
+        self.assertIsNone(self.animation_queue.find_animation_by_id(removed["id"]))
+
+        completed = self.animation_queue.update_all_animations(1000150)
+
+        self.assertEqual(completed, [short])
+        self.assertTrue(short["completed"])
+        self.assertIsNone(self.animation_queue.find_animation_by_id(short["id"]))
+        self.assertEqual(self.animation_queue.animations, [long])
+        self.assertAlmostEqual(long["progress"], 150 / 400)
+        self.assertEqual(removed["progress"], 0.0)  # removed animations are no longer updated
+
+        self.assertEqual(self.animation_queue.update_all_animations(1000400), [long])
+        self.assertFalse(self.animation_queue.has_active_animations())
+
+
 if __name__ == '__main__':
     unittest.main()
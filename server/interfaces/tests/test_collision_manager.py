@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+🧪 Tests for CollisionManager cell resolution
+"""
+
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from CollisionManager import CollisionManager
+
+
+def make_piece(piece_id, color, moving, state=None, last_action_time=0):
+    physics = SimpleNamespace(current_cell=(3, 3), target_cell=(1, 3) if moving else (3, 3), is_moving=moving)
+    return SimpleNamespace(
+        piece_id=piece_id,
+        color=color,
+        current_state=SimpleNamespace(physics=physics, state=state or ("move" if moving else "idle")),
+        cooldown_system=SimpleNamespace(last_action_time=last_action_time),
+    )
+
+
+class TestCollisionManager(unittest.TestCase):
+    """Test suite for resolving pieces that share a cell"""
+
+    def setUp(self):
+        self.collision_manager = CollisionManager()
+
+    def assertBlocked(self, piece):
+        self.assertFalse(piece.current_state.physics.is_moving)
+        self.assertEqual(piece.current_state.physics.target_cell, piece.current_state.physics.current_cell)
+
+    def test_stationary_and_moving_friends_block_the_moving_piece(self):
+        """🧪 Test that a piece moving onto a friendly resting piece is blocked"""
+        resting = make_piece("RW00", "White", moving=False)
+        arriving = make_piece("QW01", "White", moving=True)
+        captured = []
+
+        self.collision_manager.resolve_cell_collision([arriving, resting], captured)
+
+        self.assertBlocked(arriving)
+        self.assertEqual(resting.current_state.physics.target_cell, (3, 3))
+        self.assertEqual(captured, [])
+        print("✅ Stationary and moving friendly collision test passed!")
+
+    def test_two_moving_friends_block_all_but_the_first(self):
+        """🧪 Test that only the first of two moving friendly pieces keeps moving"""
+        first = make_piece("RB00", "Black", moving=True)
+        second = make_piece("QB01", "Black", moving=True)
+        captured = []
+
+        self.collision_manager.resolve_cell_collision([first, second], captured)
+
+        self.assertTrue(first.current_state.physics.is_moving)
+        self.assertEqual(first.current_state.physics.target_cell, (1, 3))
+        self.assertBlocked(second)
+        self.assertEqual(captured, [])
+        print("✅ Moving and moving friendly collision test passed!")
+
+    def test_moving_piece_captures_resting_enemy(self):
+        """🧪 Test that the moving piece captures the resting enemy"""
+        defender = make_piece("PB10", "Black", moving=False)
+        attacker = make_piece("QW01", "White", moving=True)
+        captured = []
+
+        self.collision_manager.resolve_cell_collision([defender, attacker], captured)
+
+        self.assertEqual(captured, [defender])
+        self.assertTrue(attacker.current_state.physics.is_moving)
+        print("✅ Enemy capture test passed!")
+
+    def test_blocked_piece_is_not_treated_as_attacker(self):
+        """🧪 Test that a friendly block is applied before attacker and defender are chosen"""
+        enemy = make_piece("PB10", "Black", moving=False, last_action_time=100)
+        blocked = make_piece("QW01", "White", moving=True, state="idle", last_action_time=300)
+        friend = make_piece("RW00", "White", moving=False, last_action_time=200)
+        captured = []
+
+        self.collision_manager.resolve_cell_collision([enemy, blocked, friend], captured)
+
+        self.assertBlocked(blocked)
+        # Nobody is moving any more, so the latest actor takes the earliest one
+        self.assertEqual(captured, [enemy])
+        print("✅ Blocked piece capture test passed!")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
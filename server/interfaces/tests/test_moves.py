@@ -8,6 +8,7 @@ import sys
 import os
 import tempfile
 import pathlib
+from types import SimpleNamespace
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -99,5 +100,77 @@ class TestMoves(unittest.TestCase):
         
         print("✅ Different board dimensions test passed!")
 
+    def _create_moves_file(self, deltas):
+        with tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix='.txt') as f:
+            for row_delta, col_delta in deltas:
+                f.write(f"{row_delta},{col_delta}\n")
+            return pathlib.Path(f.name)
+
+    def _pieces_at(self, *cells):
+        return {f"P{index}": SimpleNamespace(current_state=SimpleNamespace(
+                    physics=SimpleNamespace(current_board_cell=cell)))
+                for index, cell in enumerate(cells)}
+
+    def test_path_blocking_on_ranks_files_and_diagonals(self):
+        """🧪 Test blocked and clear paths along a rank, a file and both diagonals"""
+        moves = Moves(pathlib.Path("nonexistent_moves.txt"), (8, 8))
+        cases = [
+            ((3, 0), (3, 6), (3, 4), (2, 4)),  # rank
+            ((7, 2), (1, 2), (4, 2), (4, 3)),  # file
+            ((0, 0), (5, 5), (2, 2), (2, 3)),  # diagonal
+            ((6, 1), (2, 5), (4, 3), (3, 3)),  # anti-diagonal
+        ]
+        for start, target, between, off_path in cases:
+            with self.subTest(start=start, target=target):
+                self.assertTrue(moves.is_movement_path_blocked_by_pieces(
+                    start, target, "Q", self._pieces_at(start, between)))
+                # Pieces on the end squares or off the line do not block
+                self.assertFalse(moves.is_movement_path_blocked_by_pieces(
+                    start, target, "Q", self._pieces_at(start, target, off_path)))
+        print("✅ Path blocking test passed!")
+
+    def test_adjacent_and_knight_paths_are_never_blocked(self):
+        """🧪 Test that adjacent moves and knights ignore pieces in the way"""
+        moves = Moves(pathlib.Path("nonexistent_moves.txt"), (8, 8))
+        crowded = self._pieces_at(*[(row, col) for row in range(8) for col in range(8)])
+
+        self.assertFalse(moves.is_movement_path_blocked_by_pieces((3, 3), (4, 4), "K", crowded))
+        self.assertTrue(moves.is_movement_path_blocked_by_pieces((0, 0), (0, 7), "R", crowded))
+        self.assertFalse(moves.is_movement_path_blocked_by_pieces((0, 0), (0, 7), "N", crowded))
+        print("✅ Adjacent and knight path test passed!")
+
+    def test_occupancy_mask_skips_pieces_off_the_board(self):
+        """🧪 Test that off-board pieces neither raise nor set a board bit"""
+        moves = Moves(pathlib.Path("nonexistent_moves.txt"), (8, 8))
+        pieces = self._pieces_at((0, 1), (-1, 3), (2, 8), (8, 0))
+
+        self.assertEqual(moves.calculate_occupancy_mask(pieces), 1 << 1)
+        self.assertFalse(moves.is_movement_path_blocked_by_pieces((0, 0), (3, 3), "B", pieces))
+        print("✅ Occupancy mask bounds test passed!")
+
+    def test_is_target_reachable_from_position(self):
+        """🧪 Test reachability on the board, at its edges and from off the board"""
+        temp_path = self._create_moves_file([(-2, -1), (-2, 1), (1, 2), (2, 1)])
+        try:
+            moves = Moves(temp_path, (8, 8))
+
+            self.assertTrue(moves.is_target_reachable_from_position((4, 4), (2, 3)))
+            self.assertTrue(moves.is_target_reachable_from_position((4, 4), (6, 5)))
+            self.assertFalse(moves.is_target_reachable_from_position((4, 4), (6, 3)))
+            self.assertFalse(moves.is_target_reachable_from_position((4, 4), (4, 4)))
+            # Targets off the board are never reachable
+            self.assertFalse(moves.is_target_reachable_from_position((7, 7), (8, 9)))
+            self.assertFalse(moves.is_target_reachable_from_position((1, 0), (-1, -1)))
+            # Off-board origins fall back to the delta set
+            self.assertTrue(moves.is_target_reachable_from_position((-1, 0), (0, 2)))
+            # Every on-board pair agrees with the deltas
+            for start in [(row, col) for row in range(8) for col in range(8)]:
+                for target in [(row, col) for row in range(8) for col in range(8)]:
+                    expected = (target[0] - start[0], target[1] - start[1]) in moves.movement_delta_set
+                    self.assertEqual(moves.is_target_reachable_from_position(start, target), expected)
+            print("✅ Target reachability test passed!")
+        finally:
+            temp_path.unlink()
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
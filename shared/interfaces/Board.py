@@ -1,6 +1,6 @@
 """Chess board with image storage and cell dimensions."""
 from dataclasses import dataclass, field
-import copy
+import numpy as np
 from img import Img
 
 @dataclass
@@ -14,18 +14,29 @@ class Board:
 
     def __post_init__(self):
         self.original_img = Img()
-        self.original_img.img = copy.deepcopy(self.img.img)
+        if self.img.img is not None:
+            self.original_img.img = self.img.img.copy()
 
-    def clone(self) -> "Board":
+    def fresh_img_buffer(self) -> Img:
+        """Return a writable copy of the board pixels without building a new Board."""
         new_img = Img()
-        new_img.img = copy.deepcopy(self.img.img)
+        if self.img.img is not None:
+            new_img.img = self.img.img.copy()
+        return new_img
+
+    def clone(self) -> "Board":
         return Board(
             self.cell_H_pix,
             self.cell_W_pix,
             self.W_cells,
             self.H_cells,
-            new_img
+            self.fresh_img_buffer()
         )
+
+    def blit_original_into(self, dst: np.ndarray):
+        """Copy the pristine board pixels into an existing buffer of the same shape."""
+        np.copyto(dst, self.original_img.img)
     
     def reset_board(self):
-        self.img.img = copy.deepcopy(self.original_img.img)
+        if self.original_img.img is not None:
+            self.blit_original_into(self.img.img)
@@ -2,6 +2,23 @@
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
+
+class CommandType:
+    """Command type names. Plain interned strings, so they stay JSON- and config-friendly."""
+    MOVE = "Move"
+    JUMP = "Jump"
+    IDLE = "idle"
+    PROMOTION = "Promotion"
+    COMPLETE = "complete"
+    TIMEOUT = "timeout"
+    QUIT = "QUIT"
+    SHOW_STATS = "SHOW_STATS"
+
+
+# Player who moves the pieces of each piece-id color code (piece_id[1])
+PLAYER_BY_COLOR_CODE = {"W": "A", "B": "B"}
+
+
 @dataclass
 class Command:
     timestamp: int
@@ -12,29 +29,31 @@ class Command:
     def __post_init__(self):
         if not isinstance(self.params, list):
             self.params = []
+        # Derived once here so every subscriber reads it instead of reparsing piece_id
+        self.player = PLAYER_BY_COLOR_CODE.get(self.piece_id[1:2])
     
     @classmethod
     def create_move_command(cls, timestamp: int, piece_id: str, 
                           start_position: Tuple[int, int], 
                           end_position: Tuple[int, int]) -> "Command":
-        return cls(timestamp, piece_id, "Move", [start_position, end_position])
+        return cls(timestamp, piece_id, CommandType.MOVE, [start_position, end_position])
     
     @classmethod 
     def create_jump_command(cls, timestamp: int, piece_id: str,
                           start_position: Tuple[int, int], 
                           landing_position: Tuple[int, int]) -> "Command":
-        return cls(timestamp, piece_id, "Jump", [start_position, landing_position])
+        return cls(timestamp, piece_id, CommandType.JUMP, [start_position, landing_position])
     
     @classmethod
     def create_idle_command(cls, timestamp: int, piece_id: str) -> "Command":
-        return cls(timestamp, piece_id, "idle", [])
+        return cls(timestamp, piece_id, CommandType.IDLE, [])
     
     @classmethod
     def create_promotion_command(cls, timestamp: int, piece_id: str,
                                start_position: Tuple[int, int], 
                                promotion_position: Tuple[int, int],
                                selected_piece_type: str) -> "Command":
-        return cls(timestamp, piece_id, "Promotion", 
+        return cls(timestamp, piece_id, CommandType.PROMOTION, 
                   [start_position, promotion_position, selected_piece_type])
     
     def get_source_cell(self) -> Optional[Tuple[int, int]]:
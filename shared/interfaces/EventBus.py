@@ -13,15 +13,20 @@ class GameEventNotificationSystem:
         self.event_type_to_listeners_mapping[event_type].append(listening_component)
 
     def remove_component_from_event_notifications(self, event_type: str, listening_component) -> None:
-        if event_type in self.event_type_to_listeners_mapping:
-            self.event_type_to_listeners_mapping[event_type].remove(listening_component)
-            if not self.event_type_to_listeners_mapping[event_type]:
-                del self.event_type_to_listeners_mapping[event_type]
+        listeners = self.event_type_to_listeners_mapping.get(event_type)
+        if listeners is None:
+            return
+        listeners.remove(listening_component)
+        if not listeners:
+            del self.event_type_to_listeners_mapping[event_type]
 
     def broadcast_event_to_all_registered_listeners(self, event_type: str, event_data: Optional[Any] = None) -> None:
-        if event_type in self.event_type_to_listeners_mapping:
-            for listening_component in self.event_type_to_listeners_mapping[event_type]:
-                listening_component.update(event_type, event_data)
+        # No per-listener try/except: listener errors propagate to the publisher.
+        listeners = self.event_type_to_listeners_mapping.get(event_type)
+        if not listeners:
+            return
+        for listening_component in listeners:
+            listening_component.update(event_type, event_data)
 
 
 # Backward compatibility aliases
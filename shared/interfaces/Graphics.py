@@ -2,11 +2,31 @@ import pathlib
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
 import copy
+import functools
 import numpy as np
 from img import Img
 from Command import Command
+from EventTypes import GAME_STARTED, GAME_ENDED
+
+# Sprite image files (.png/.jpg/.jpeg in any letter case), matched by glob
+_SPRITE_FILE_PATTERNS = ('*.[pP][nN][gG]', '*.[jJ][pP][gG]', '*.[jJ][pP][eE][gG]')
+
+
+@functools.lru_cache(maxsize=None)
+def _load_sprite_frames(sprites_folder: pathlib.Path, cell_size: tuple[int, int]) -> Tuple[Img, ...]:
+    """Decode a sprites folder once; every Graphics for the same folder shares the frames."""
+    if not sprites_folder.exists():
+        return ()
+    sprite_files = sorted(f for pattern in _SPRITE_FILE_PATTERNS for f in sprites_folder.glob(pattern))
+    return tuple(Img().read(sprite_file, size=cell_size, keep_aspect=True) for sprite_file in sprite_files)
+
 
 class Graphics:
+    # Number of distinct rest-tint strengths; tinted frames are cached per level
+    TINT_LEVELS = 16
+    # States whose frames get the blue rest tint
+    TINTED_STATES = ("long_rest", "short_rest")
+
     def __init__(self, sprites_folder: pathlib.Path, cell_size: tuple[int, int], 
                  loop: bool = True, fps: float = 6.0, state_name: str = ""):
         """Initialize graphics with sprites folder, cell size, loop setting, and FPS."""
@@ -17,27 +37,30 @@ class Graphics:
         self.frame_duration_ms = int(1000 / fps)
         self.state_name = state_name  # Track which state this graphics is for
         
-        # Load sprites
-        self.frames = []
-        if sprites_folder.exists():
-            sprite_files = sorted([f for f in sprites_folder.iterdir() 
-                                 if f.suffix.lower() in ['.png', '.jpg', '.jpeg']])
-            
-            for sprite_file in sprite_files:
-                img = Img().read(sprite_file, size=cell_size, keep_aspect=True)
-                self.frames.append(img)
+        # Load sprites (decoded once per folder and size, the Img objects are shared)
+        self.frames = list(_load_sprite_frames(sprites_folder, tuple(cell_size)))
         
         self.current_frame = 0
         self.animation_start_time = 0
         self.current_command = None
+        self._tint_cache: Dict[Tuple[int, int], Img] = {}
+
+    @property
+    def state_name(self) -> str:
+        return self._state_name
+
+    @state_name.setter
+    def state_name(self, value: str):
+        # Resolved once here rather than string-compared in get_img every frame
+        self._state_name = value
+        self._is_tinted_state = value in self.TINTED_STATES
 
     def copy(self):
         """Create a shallow copy of the graphics object."""
-        new_graphics = Graphics(self.sprites_folder, self.cell_size, self.loop, self.fps, self.state_name)
+        # No re-scan of the sprites folder: the copy shares the frame images and
+        # the tint cache built from them, only the animation state is its own
+        new_graphics = copy.copy(self)
         new_graphics.frames = self.frames.copy()
-        new_graphics.current_frame = self.current_frame
-        new_graphics.animation_start_time = self.animation_start_time
-        new_graphics.current_command = self.current_command
         return new_graphics
 
     def reset(self, cmd: Command):
@@ -48,19 +71,21 @@ class Graphics:
 
     def update(self, now_ms: int):
         """Advance animation frame based on game-loop time, not wall time."""
-        if not self.frames or not self.current_command:
+        frames = self.frames
+        if not frames or not self.current_command:
             return
             
+        # Whole frames elapsed: integer floor division on the integer game clock,
+        # and an animation whose start is still ahead stays on its first frame
         elapsed = now_ms - self.animation_start_time
-        frame_index = int(elapsed / self.frame_duration_ms)
+        frame_index = elapsed // self.frame_duration_ms if elapsed > 0 else 0
         
         if self.loop:
-            self.current_frame = frame_index % len(self.frames)
+            self.current_frame = frame_index % len(frames)
         else:
-            self.current_frame = min(frame_index, len(self.frames) - 1)
+            self.current_frame = min(frame_index, len(frames) - 1)
 
     def update_event(self, event_type, data):
-        from EventTypes import GAME_STARTED, GAME_ENDED
         if event_type == GAME_STARTED:
             pass
         elif event_type == GAME_ENDED:
@@ -72,13 +97,22 @@ class Graphics:
             current_img = self.frames[self.current_frame]
             
             # Apply dynamic blue tint for rest states
-            if self.state_name in ["long_rest", "short_rest"] and rest_duration_ms > 0:
+            if self._is_tinted_state and rest_duration_ms > 0:
                 # Calculate remaining time ratio (1.0 = full time left, 0.0 = no time left)
                 elapsed_ms = now_ms - state_start_time
                 remaining_ms = max(0, rest_duration_ms - elapsed_ms)
                 intensity_ratio = remaining_ms / rest_duration_ms
                 
-                return current_img.apply_blue_tint(intensity=intensity_ratio)
+                # Quantize so each (frame, level) is tinted once and then reused
+                level = int(intensity_ratio * self.TINT_LEVELS)
+                if level == 0:
+                    return current_img
+                key = (self.current_frame, level)
+                tinted = self._tint_cache.get(key)
+                if tinted is None:
+                    tinted = current_img.apply_blue_tint(intensity=level / self.TINT_LEVELS)
+                    self._tint_cache[key] = tinted
+                return tinted
             else:
                 return current_img
         else:
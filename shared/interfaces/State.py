@@ -1,6 +1,7 @@
-from Command import Command
+from Command import Command, CommandType
 from Moves import Moves
 from Graphics import Graphics  
+from GraphicsFactory import GraphicsFactory
 from Physics import Physics
 from typing import Dict, Optional
 import pathlib
@@ -88,8 +89,6 @@ class GamePieceStateManager:
 
     def create_visual_renderer_for_target_state(self, template_state: "GamePieceStateManager") -> Graphics:
         """Create new Graphics object with correct state name and sprites folder."""
-        from GraphicsFactory import GraphicsFactory
-        
         correct_sprites_folder = GamePieceSpritesPathManager.build_sprites_directory_path_for_target_state(
             template_state.visual_renderer.sprites_folder, 
             template_state.current_state_name
@@ -213,7 +212,8 @@ class GamePieceStateManager:
     def update_state_and_check_for_transitions(self, current_time_ms: int) -> "GamePieceStateManager":
         """Update the state based on current time."""
         self.visual_renderer.update(current_time_ms)
-        movement_complete = self.movement_physics.update_movement_state(current_time_ms)
+        # Also settles this tick's pixel position, so drawing the piece reuses it
+        _, movement_complete = self.movement_physics.advance_movement(current_time_ms)
         
         # Check for completion transitions
         if movement_complete and "complete" in self.state_transition_mapping:
@@ -230,20 +230,20 @@ class GamePieceStateManager:
     def execute_completion_state_transition(self, current_time_ms: int) -> "GamePieceStateManager":
         """Handle completion transition."""
         template_state = self.state_transition_mapping["complete"]
-        completion_cmd = Command(current_time_ms, "", "complete", [])
+        completion_cmd = Command(current_time_ms, "", CommandType.COMPLETE, [])
         return self.build_new_state_from_transition_template(template_state, completion_cmd)
 
     def execute_timeout_state_transition(self, current_time_ms: int) -> "GamePieceStateManager":
         """Handle timeout transition."""
         template_state = self.state_transition_mapping["timeout"]
-        timeout_cmd = Command(current_time_ms, "", "timeout", [])
+        timeout_cmd = Command(current_time_ms, "", CommandType.TIMEOUT, [])
         return self.build_new_state_from_transition_template(template_state, timeout_cmd)
 
     def handle_automatic_state_transitions(self, current_time_ms: int) -> "GamePieceStateManager":
         """Handle state-specific update logic."""
         if self.current_state_name == "move" and not self.movement_physics.is_moving:
             return self.calculate_next_state_after_command_execution(
-                Command(current_time_ms, "", "complete", []), current_time_ms)
+                Command(current_time_ms, "", CommandType.COMPLETE, []), current_time_ms)
         return self
     
     def retrieve_active_command(self) -> Command:
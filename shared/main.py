@@ -8,8 +8,8 @@ def main():
         pygame.init()
         pygame.display.init()
         
-        begin_image = pygame.image.load("pictures/begin.jpg")
         screen = pygame.display.set_mode((1024, 768))
+        begin_image = pygame.image.load("pictures/begin.jpg").convert()
         pygame.display.set_caption("🎮 Chess Game Starting...")
         
         # Scale and center image